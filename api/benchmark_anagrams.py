@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Lookup benchmark: AnagramIndex vs a brute-force vocabulary scan
+Times anagram and "words from these letters" queries against scanning every word per query
+
+The brute-force scan runs over the already-filtered word index, so it is a lower
+bound on the cost of the per-request wn.words() scan it replaces.
+
+Examples:
+    uv run python benchmark_anagrams.py                     # uses lambda/word_index.bin
+    uv run python benchmark_anagrams.py --synthetic 100000  # offline, no WordNet needed
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+# Add lambda directory to path
+lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda')
+sys.path.insert(0, lambda_dir)
+
+from anagrams import AnagramIndex  # noqa: E402
+from word_store import CompactWordStore  # noqa: E402
+
+# Weighted towards common letters so synthetic words share letters like real ones
+LETTER_WEIGHTS = 'EEEEEEETTTTTAAAAAOOOOIIIINNNNSSSSHHHRRRDDLLCCUUMMWFGYPBVKJXQZ'
+
+
+def synthetic_store(count: int, seed: int = 0) -> CompactWordStore:
+    """Build a store of random letter strings of length 3-10."""
+    rng = random.Random(seed)
+    words = {''.join(rng.choice(LETTER_WEIGHTS) for _ in range(rng.randint(3, 10))) for _ in range(count)}
+    return CompactWordStore.build({'word': word, 'length': len(word), 'definitions': []} for word in words)
+
+
+def brute_anagrams(words, letters: str):
+    """Scan every word for one with the same sorted letters."""
+    signature = sorted(letters.upper())
+    return sorted(word for word in words if len(word) == len(signature) and sorted(word) == signature)
+
+
+def brute_subwords(words, letters: str, min_length: int = 3):
+    """Scan every word for one spellable from the letters."""
+    available = Counter(letters.upper())
+    found = [word for word in words if min_length <= len(word) <= len(letters) and not Counter(word) - available]
+    return sorted(found, key=lambda word: (-len(word), word))
+
+
+def time_queries(func, queries) -> float:
+    """Return the mean time per query in microseconds."""
+    start = time.perf_counter()
+    for query in queries:
+        func(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main(argv=None):
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description='Compare AnagramIndex lookups with a brute-force scan')
+    parser.add_argument('--index', default=os.path.join(lambda_dir, 'word_index.bin'),
+                        help='Word index to benchmark (default: lambda/word_index.bin)')
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='Benchmark N synthetic words instead of a built index')
+    parser.add_argument('--queries', type=int, default=200, help='Queries per benchmark (default: 200)')
+    parser.add_argument('--rack', type=int, default=7, help='Letters per subword query (default: 7)')
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        store = synthetic_store(args.synthetic)
+    else:
+        if not os.path.exists(args.index):
+            parser.error(f"{args.index} not found; run build_word_index.py or use --synthetic N")
+        store = CompactWordStore.load(args.index)
+
+    start = time.perf_counter()
+    index = AnagramIndex.build(store)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    words = [word for word in (store.word(i) for i in range(len(store))) if word.isascii() and word.isalpha()]
+    rng = random.Random(0)
+    anagram_queries = [rng.choice(words) for _ in range(args.queries)]
+    rack_queries = [''.join(rng.choice(LETTER_WEIGHTS) for _ in range(args.rack)) for _ in range(args.queries)]
+
+    # Brute force is slow, so it runs on a subset of the queries
+    brute_count = max(1, args.queries // 10)
+    for query in anagram_queries[:brute_count]:
+        assert index.anagrams(query) == brute_anagrams(words, query), query
+    for query in rack_queries[:brute_count]:
+        assert index.subwords(query) == brute_subwords(words, query), query
+
+    results = [
+        ('anagrams', time_queries(index.anagrams, anagram_queries),
+         time_queries(lambda q: brute_anagrams(words, q), anagram_queries[:brute_count])),
+        (f'subwords ({args.rack} letters)', time_queries(index.subwords, rack_queries),
+         time_queries(lambda q: brute_subwords(words, q), rack_queries[:brute_count])),
+    ]
+
+    print("=" * 60)
+    print(f"Anagram benchmark: {len(index)} words, {index.signature_count()} signatures")
+    print(f"Index build: {build_ms:.1f} ms (once per container)")
+    print("=" * 60)
+    print(f"{'Query':<24}{'Index':>12}{'Brute force':>14}{'Speedup':>10}")
+    for name, index_us, brute_us in results:
+        print(f"{name:<24}{index_us:>9.1f} us{brute_us:>11.0f} us{brute_us / index_us:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
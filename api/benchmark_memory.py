@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: dict-based word cache vs CompactWordStore
+Measures the heap used by each layout for the same entries with tracemalloc
+
+Examples:
+    uv run python benchmark_memory.py                     # uses lambda/word_index.bin
+    uv run python benchmark_memory.py --synthetic 100000  # offline, no WordNet needed
+"""
+import argparse
+import gc
+import os
+import random
+import string
+import sys
+import tempfile
+import tracemalloc
+
+# Add lambda directory to path
+lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda')
+sys.path.insert(0, lambda_dir)
+
+from word_store import CompactWordStore  # noqa: E402
+
+
+def synthetic_store(count: int, seed: int = 0) -> CompactWordStore:
+    """Build a store with WordNet-like shape: short words, 1-3 definitions, some shared."""
+    rng = random.Random(seed)
+    shared = [' '.join(rng.choice(string.ascii_lowercase) * rng.randint(2, 9) for _ in range(8))
+              for _ in range(count // 4)]
+    entries = []
+    for i in range(count):
+        word = ''.join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 14))) + str(i)
+        definitions = [rng.choice(shared) if rng.random() < 0.3 else
+                       ' '.join(rng.choice(string.ascii_lowercase) * rng.randint(2, 9) for _ in range(10))
+                       for _ in range(rng.randint(1, 3))]
+        entries.append({'word': word, 'length': len(word), 'definitions': definitions})
+    return CompactWordStore.build(entries)
+
+
+def measure(factory):
+    """Return (object, bytes allocated while building it)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = factory()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def dict_layout(store: CompactWordStore):
+    """The naive cache: one dict per entry, each with its own strings and list."""
+    return [store[i].to_dict() for i in range(len(store))]
+
+
+def main(argv=None):
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description='Compare memory of dict-based and compact word storage')
+    parser.add_argument('--index', default=os.path.join(lambda_dir, 'word_index.bin'),
+                        help='Word index to benchmark (default: lambda/word_index.bin)')
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='Benchmark N synthetic entries instead of a built index')
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        source = synthetic_store(args.synthetic)
+        fd, path = tempfile.mkstemp(suffix='.bin')
+        os.close(fd)
+        source.save(path)
+    else:
+        if not os.path.exists(args.index):
+            parser.error(f"{args.index} not found; run build_word_index.py or use --synthetic N")
+        path = args.index
+        source = CompactWordStore.load(path)
+
+    entries = len(source)
+    dicts, dict_bytes = measure(lambda: dict_layout(source))
+    del dicts
+    store, store_bytes = measure(lambda: CompactWordStore.load(path))
+
+    if args.synthetic:
+        os.remove(path)
+
+    print("=" * 60)
+    print(f"Memory benchmark: {entries} word entries")
+    print("=" * 60)
+    print(f"{'Layout':<24}{'Total':>14}{'Per entry':>14}")
+    print(f"{'dict per entry':<24}{dict_bytes / 2**20:>11.2f} MB{dict_bytes / entries:>12.0f} B")
+    print(f"{'CompactWordStore':<24}{store_bytes / 2**20:>11.2f} MB{store_bytes / entries:>12.0f} B")
+    print(f"\nCompact layout uses {store_bytes / dict_bytes:.1%} of the dict layout "
+          f"({dict_bytes / store_bytes:.1f}x smaller)")
+    print(f"Raw payload: {store.nbytes() / 2**20:.2f} MB")
+
+
+if __name__ == '__main__':
+    main()
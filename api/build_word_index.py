@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Build the compact word index packaged with the Lambda function
+Runs every WordNet word through the content filters once and packs the survivors
+into a CompactWordStore, so requests sample prefiltered words instead of filtering.
+Themed category membership (hypernym closures) and difficulty tiers (NumPy
+scores cut into per-length quantiles) are precomputed here too.
+
+This script should be run after download_nltk_data.py and before deploying to Lambda.
+
+Example:
+    uv run python build_word_index.py
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add lambda directory to path
+lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda')
+sys.path.insert(0, lambda_dir)
+
+from categories import attach_categories  # noqa: E402
+from difficulty import attach_difficulty  # noqa: E402
+from vocabulary import iter_candidate_words, iter_valid_entries  # noqa: E402
+from word_store import CompactWordStore  # noqa: E402
+
+
+def build_store(min_length: int = 3) -> CompactWordStore:
+    """Filter the whole vocabulary and pack it into a store."""
+    return CompactWordStore.build(iter_valid_entries(iter_candidate_words(min_length)))
+
+
+def main(argv=None):
+    """Parse arguments, build the index and write it next to the handler."""
+    parser = argparse.ArgumentParser(description='Build the compact word index for the Lambda function')
+    parser.add_argument('--output', default=os.path.join(lambda_dir, 'word_index.bin'),
+                        help='Output file (default: lambda/word_index.bin)')
+    args = parser.parse_args(argv)
+
+    print("Filtering WordNet vocabulary...")
+    start = time.perf_counter()
+    store = build_store()
+
+    print("Classifying themed categories...")
+    category_counts = attach_categories(store)
+
+    print("Scoring word difficulty...")
+    difficulty_counts = attach_difficulty(store)
+    store.metadata['built_at'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    store.save(args.output)
+
+    print(f"Indexed {len(store)} words in {time.perf_counter() - start:.1f}s")
+    print(f"Words per length: {store.lengths()}")
+    print(f"Words per category: {category_counts}")
+    print(f"Words per difficulty: {difficulty_counts}")
+    print(f"Payload size: {store.nbytes() / 1024:.1f} KiB")
+    print(f"\n✅ Word index written to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
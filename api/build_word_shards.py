@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Build static, CDN-cacheable word shards for the frontend
+Writes one content-hashed, gzip-compressed JSON file per word length plus a manifest
+
+The frontend samples words locally from these shards and only calls the API on a
+miss, so most games never invoke Lambda. Terraform publishes the output to the
+frontend S3 bucket under /word-shards/ (see terraform/frontend.tf).
+
+Shard layout (served with Content-Encoding: gzip):
+    {"length": 5, "words": ["HOUSE", ...], "definitions": [["a dwelling ..."], ...]}
+
+Manifest layout (manifest.json, short cache):
+    {"version": 1, "shards": {"5": {"file": "words-5.3f2a9c1d0b7e.json", "count": 4123}}}
+
+Example:
+    uv run python build_word_shards.py --output build/word-shards
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+# Add lambda directory to path
+lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda')
+sys.path.insert(0, lambda_dir)
+
+from vocabulary import iter_candidate_words, iter_valid_entries, validate_length_range  # noqa: E402
+
+MANIFEST_VERSION = 1
+HASH_LENGTH = 12
+
+
+def build_shard(length: int) -> tuple[bytes, int]:
+    """Build the uncompressed JSON shard for one word length.
+
+    Returns:
+        Tuple of (shard JSON bytes, number of words)
+    """
+    words = []
+    definitions = []
+    for entry in iter_valid_entries(iter_candidate_words(length, length)):
+        words.append(entry['word'])
+        definitions.append(entry['definitions'])
+
+    # Sort for reproducible content hashes across builds
+    order = sorted(range(len(words)), key=words.__getitem__)
+    shard = {
+        'length': length,
+        'words': [words[i] for i in order],
+        'definitions': [definitions[i] for i in order],
+    }
+    return json.dumps(shard, separators=(',', ':')).encode('utf-8'), len(words)
+
+
+def write_shards(output_dir: str, min_length: int, max_length: int) -> dict:
+    """Write compressed shards and the manifest, returning the manifest."""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {'version': MANIFEST_VERSION, 'shards': {}}
+
+    for length in range(min_length, max_length + 1):
+        data, count = build_shard(length)
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        filename = f'words-{length}.{digest}.json'
+
+        # mtime=0 keeps the compressed bytes reproducible for unchanged content
+        with open(os.path.join(output_dir, filename), 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+
+        manifest['shards'][str(length)] = {'file': filename, 'count': count}
+        print(f"Length {length:>2}: {count:>6} words -> {filename}")
+
+    # Remove shards from previous builds so a sync only publishes the current set
+    current = {shard['file'] for shard in manifest['shards'].values()}
+    for name in os.listdir(output_dir):
+        if name.startswith('words-') and name.endswith('.json') and name not in current:
+            os.remove(os.path.join(output_dir, name))
+
+    with open(os.path.join(output_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def main(argv=None):
+    """Parse arguments and build the shards."""
+    parser = argparse.ArgumentParser(description='Build static per-length word shards for the frontend')
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'build', 'word-shards'),
+                        help='Output directory (default: api/build/word-shards)')
+    parser.add_argument('--min-length', type=int, default=3, help='Shortest word length (default: 3)')
+    parser.add_argument('--max-length', type=int, default=20, help='Longest word length (default: 20)')
+    args = parser.parse_args(argv)
+
+    try:
+        validate_length_range(args.min_length, args.max_length)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"Building word shards in: {args.output}")
+    write_shards(args.output, args.min_length, args.max_length)
+    print("\n✅ Word shards built!")
+
+
+if __name__ == '__main__':
+    main()
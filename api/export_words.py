@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Export the full filtered vocabulary as NDJSON for offline word packs
+Streams every word that passes the content filters, with definitions, one JSON object per line
+
+Examples:
+    uv run python export_words.py --min-length 5 --max-length 8 > words.ndjson
+    uv run python export_words.py --gzip -o words.ndjson.gz
+"""
+import argparse
+import os
+import sys
+
+# Add lambda directory to path
+lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda')
+sys.path.insert(0, lambda_dir)
+
+from vocabulary import export_vocabulary  # noqa: E402
+
+
+def main(argv=None):
+    """Parse arguments and stream the export to a file or stdout."""
+    parser = argparse.ArgumentParser(description='Export the filtered vocabulary as NDJSON')
+    parser.add_argument('--min-length', type=int, default=3, help='Minimum word length (default: 3)')
+    parser.add_argument('--max-length', type=int, default=None, help='Maximum word length (default: no limit)')
+    parser.add_argument('--gzip', action='store_true', help='Gzip-compress the output')
+    parser.add_argument('-o', '--output', help='Output file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    try:
+        chunks = export_vocabulary(args.min_length, args.max_length, compress=args.gzip)
+    except ValueError as e:
+        parser.error(str(e))
+
+    out = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+        else:
+            out.flush()
+
+
+if __name__ == '__main__':
+    main()
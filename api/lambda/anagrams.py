@@ -0,0 +1,138 @@
+"""
+Anagram and letter-multiset lookups over the filtered vocabulary
+Words are grouped by sorted-letter signature, and signatures by the set of letters they use
+"""
+import string
+from array import array
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from word_store import CompactWordStore
+
+MIN_LETTERS = 3
+MAX_LETTERS = 16
+
+_LETTER_BITS = {letter: 1 << i for i, letter in enumerate(string.ascii_uppercase)}
+
+# Signature, plus (letter, count) for each letter it uses more than once
+_SignatureGroup = Tuple[str, Tuple[Tuple[str, int], ...]]
+
+
+def letter_mask(letters: str) -> int:
+    """26-bit mask of the distinct letters in an uppercase string."""
+    mask = 0
+    for letter in letters:
+        mask |= _LETTER_BITS[letter]
+    return mask
+
+
+def normalize_letters(letters: str) -> str:
+    """Uppercase and validate a letters query.
+
+    Raises:
+        ValueError: If the query has non-letters or is outside MIN_LETTERS..MAX_LETTERS
+    """
+    letters = letters.strip().upper()
+    if not MIN_LETTERS <= len(letters) <= MAX_LETTERS:
+        raise ValueError(f'letters must be {MIN_LETTERS} to {MAX_LETTERS} characters long')
+    if not all(letter in _LETTER_BITS for letter in letters):
+        raise ValueError('letters must only contain A-Z')
+    return letters
+
+
+class AnagramIndex:
+    """Anagram and "words from these letters" lookups over a word store.
+
+    - Anagrams: words keyed by their sorted letters (signature), so all
+      anagrams of a query are one dict lookup.
+    - Sub-multisets: signatures grouped by the bitmask of distinct letters
+      they use. A word can be spelled from the query only if its mask is a
+      subset of the query's mask, so only those groups are visited, either by
+      enumerating the query mask's submasks or, for queries with many
+      distinct letters, by scanning the group masks. Letter counts are then
+      checked only for the letters a signature repeats.
+
+    Words containing anything other than A-Z are not indexed.
+
+    Example:
+        >>> index = AnagramIndex.build(store)
+        >>> index.anagrams('stare')
+        ['ASTER', 'RATES', 'STARE', 'TEARS']
+        >>> index.subwords('cats')
+        ['CATS', 'SCAT', 'ACT', 'CAT', 'SAC']
+    """
+
+    def __init__(self, store: CompactWordStore, by_signature: Dict[str, array],
+                 by_mask: Dict[int, List[_SignatureGroup]]):
+        self._store = store
+        self._by_signature = by_signature
+        self._by_mask = by_mask
+        self._masks = tuple(by_mask)
+
+    @classmethod
+    def build(cls, store: CompactWordStore) -> 'AnagramIndex':
+        """Index every A-Z word in a store (one pass, run once per container)."""
+        by_signature: Dict[str, array] = {}
+        for entry_id in range(len(store)):
+            word = store.word(entry_id)
+            if all(letter in _LETTER_BITS for letter in word):
+                by_signature.setdefault(''.join(sorted(word)), array('I')).append(entry_id)
+
+        by_mask: Dict[int, List[_SignatureGroup]] = {}
+        for signature in by_signature:
+            repeats = tuple((letter, count) for letter, count in sorted(Counter(signature).items()) if count > 1)
+            by_mask.setdefault(letter_mask(signature), []).append((signature, repeats))
+
+        return cls(store, by_signature, by_mask)
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._by_signature.values())
+
+    def signature_count(self) -> int:
+        """Number of distinct sorted-letter signatures."""
+        return len(self._by_signature)
+
+    def _words(self, signature: str) -> List[str]:
+        return [self._store.word(entry_id) for entry_id in self._by_signature.get(signature, ())]
+
+    def anagrams(self, letters: str) -> List[str]:
+        """All indexed words using exactly these letters, sorted.
+
+        Raises:
+            ValueError: If letters is not a valid query (see normalize_letters)
+        """
+        return sorted(self._words(''.join(sorted(normalize_letters(letters)))))
+
+    def _submasks(self, mask: int) -> List[int]:
+        distinct = bin(mask).count('1')
+        if 1 << distinct <= len(self._masks):
+            # Enumerate every subset of the query's letters
+            submasks = []
+            submask = mask
+            while submask:
+                if submask in self._by_mask:
+                    submasks.append(submask)
+                submask = (submask - 1) & mask
+            return submasks
+        return [candidate for candidate in self._masks if candidate & ~mask == 0]
+
+    def subwords(self, letters: str, min_length: int = MIN_LETTERS) -> List[str]:
+        """All indexed words that can be spelled from these letters.
+
+        Each letter may be used at most as many times as it appears in the
+        query. Results are sorted longest first, then alphabetically.
+
+        Raises:
+            ValueError: If letters is not a valid query (see normalize_letters)
+        """
+        letters = normalize_letters(letters)
+        counts = {letter: letters.count(letter) for letter in set(letters)}
+
+        words = []
+        for submask in self._submasks(letter_mask(letters)):
+            for signature, repeats in self._by_mask[submask]:
+                if len(signature) >= min_length and all(counts[letter] >= n for letter, n in repeats):
+                    words.extend(self._words(signature))
+
+        words.sort(key=lambda word: (-len(word), word))
+        return words
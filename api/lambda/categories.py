@@ -0,0 +1,99 @@
+"""
+Themed word categories backed by precomputed WordNet hypernym closures
+Category membership is computed offline into sorted id arrays stored in the word index
+"""
+import bisect
+from array import array
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from nltk.corpus import wordnet as wn
+
+from word_store import CompactWordStore
+
+# Curated category roots: a word belongs to a category if any of its noun
+# synsets has one of these synsets among its (instance) hypernym ancestors
+CATEGORY_ROOTS = {
+    'animals': ['animal.n.01'],
+    'food': ['food.n.01', 'food.n.02'],
+    'places': ['location.n.01'],
+}
+
+ARRAY_PREFIX = 'category:'
+
+
+def _ancestors(synset, cache: Dict[str, Set[str]]) -> Set[str]:
+    """Names of a synset and all its hypernym/instance-hypernym ancestors (memoized)."""
+    name = synset.name()
+    if name not in cache:
+        cache[name] = {name}  # Placeholder guards against cycles
+        result = {name}
+        for parent in synset.hypernyms() + synset.instance_hypernyms():
+            result |= _ancestors(parent, cache)
+        cache[name] = result
+    return cache[name]
+
+
+def build_category_ids(store: CompactWordStore,
+                       roots: Optional[Dict[str, Iterable[str]]] = None) -> Dict[str, array]:
+    """Compute the sorted entry ids belonging to each category (offline step).
+
+    Hypernym closures are walked once per synset and memoized, so the whole
+    vocabulary is classified in a single pass.
+
+    Args:
+        store: Word store whose entries are classified
+        roots: Mapping of category name to root synset names (default: CATEGORY_ROOTS)
+
+    Returns:
+        Mapping of category name to a sorted array('I') of entry ids
+    """
+    roots = roots or CATEGORY_ROOTS
+    root_sets = {category: set(names) for category, names in roots.items()}
+    cache: Dict[str, Set[str]] = {}
+    ids = {category: array('I') for category in root_sets}
+
+    for entry_id in range(len(store)):
+        ancestors: Set[str] = set()
+        for synset in wn.synsets(store.word(entry_id).lower(), pos='n'):
+            ancestors |= _ancestors(synset, cache)
+        for category, root_names in root_sets.items():
+            if ancestors & root_names:
+                ids[category].append(entry_id)
+
+    return ids
+
+
+def attach_categories(store: CompactWordStore,
+                      roots: Optional[Dict[str, Iterable[str]]] = None) -> Dict[str, int]:
+    """Classify a store's entries and attach the id arrays so save() persists them.
+
+    Returns:
+        Mapping of category name to number of member words
+    """
+    counts = {}
+    for category, ids in build_category_ids(store, roots).items():
+        store.arrays[ARRAY_PREFIX + category] = ids
+        counts[category] = len(ids)
+    store.metadata['categories'] = sorted(counts)
+    return counts
+
+
+def available_categories(store: Optional[CompactWordStore]) -> Tuple[str, ...]:
+    """Categories present in a loaded store (empty if there is no store)."""
+    if store is None:
+        return ()
+    return tuple(sorted(name[len(ARRAY_PREFIX):] for name in store.arrays if name.startswith(ARRAY_PREFIX)))
+
+
+def category_id_range(store: CompactWordStore, category: str, start_id: int, end_id: int) -> Tuple[array, int, int]:
+    """Intersect a category with an entry id range.
+
+    Both are sorted by id, so the intersection is a contiguous slice of the
+    category array found with two binary searches.
+
+    Returns:
+        Tuple of (category id array, lo, hi) where ids[lo:hi] are the members
+        with start_id <= id < end_id
+    """
+    ids = store.arrays[ARRAY_PREFIX + category]
+    return ids, bisect.bisect_left(ids, start_id), bisect.bisect_left(ids, end_id)
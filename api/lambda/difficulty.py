@@ -0,0 +1,151 @@
+"""
+Difficulty tiers backed by precomputed word difficulty scores
+Scores are computed in bulk with NumPy when the word index is built; requests only slice tier arrays
+"""
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from nltk.corpus import wordnet as wn
+
+from word_store import CompactWordStore
+
+# Tiers are equal-size score quantiles within each word length, easiest first
+DIFFICULTY_TIERS = ('easy', 'medium', 'hard')
+
+ARRAY_PREFIX = 'difficulty:'
+
+# Relative frequency (%) of letters in English text. Words made of common
+# letters are guessed quickly; rare letters (J, Q, X, Z) are rarely guessed early.
+LETTER_FREQUENCIES = {
+    'E': 12.7, 'T': 9.1, 'A': 8.2, 'O': 7.5, 'I': 7.0, 'N': 6.7, 'S': 6.3, 'H': 6.1,
+    'R': 6.0, 'D': 4.3, 'L': 4.0, 'C': 2.8, 'U': 2.8, 'M': 2.4, 'W': 2.4, 'F': 2.2,
+    'G': 2.0, 'Y': 2.0, 'P': 1.9, 'B': 1.5, 'V': 1.0, 'K': 0.8, 'J': 0.15, 'X': 0.15,
+    'Q': 0.1, 'Z': 0.07,
+}
+
+# Weights of the standardized features in the score (higher score = harder)
+SCORE_WEIGHTS = {
+    'letter_frequency': -1.0,  # Common letters make a word easier
+    'unique_letters': -1.0,    # More distinct letters means fewer wrong guesses
+    'lemma_count': -1.5,       # Familiar words (frequent in SemCor) are easier
+}
+
+
+def lemma_counts(words: Sequence[str]) -> List[int]:
+    """Sum WordNet (SemCor) lemma counts for each word, a proxy for word frequency."""
+    return [sum(lemma.count() for lemma in wn.lemmas(word.lower())) for word in words]
+
+
+def compute_scores(words: Sequence[str], counts: Sequence[int]):
+    """Score every word's difficulty in one vectorized pass (offline step).
+
+    Features are standardized across the vocabulary and combined with
+    SCORE_WEIGHTS:
+
+    - letter_frequency: mean English frequency of the word's distinct letters
+    - unique_letters: fraction of the word's letters that are distinct
+    - lemma_count: log of the summed WordNet lemma counts
+
+    Args:
+        words: Uppercase words
+        counts: Lemma count per word (see lemma_counts)
+
+    Returns:
+        NumPy float array of scores, higher meaning harder
+    """
+    import numpy as np  # Build-time only; NumPy is not packaged with the Lambda
+
+    n = len(words)
+    lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=n)
+    chars = np.frombuffer(''.join(words).encode('ascii', 'replace'), dtype=np.uint8)
+    owner = np.repeat(np.arange(n), lengths)
+
+    # Letter presence matrix: presence[i, c] is True if word i contains letter c
+    letters = chars - ord('A')
+    is_letter = letters < 26  # uint8 wraps non-letters above 25
+    presence = np.zeros((n, 26), dtype=bool)
+    presence[owner[is_letter], letters[is_letter]] = True
+
+    frequencies = np.array([LETTER_FREQUENCIES[chr(ord('A') + c)] for c in range(26)])
+    unique = presence.sum(axis=1)
+    features = {
+        'letter_frequency': (presence @ frequencies) / np.maximum(unique, 1),
+        'unique_letters': unique / np.maximum(lengths, 1),
+        'lemma_count': np.log1p(np.asarray(counts, dtype=np.float64)),
+    }
+
+    scores = np.zeros(n)
+    for name, values in features.items():
+        std = values.std()
+        if std > 0:
+            scores += SCORE_WEIGHTS[name] * (values - values.mean()) / std
+    return scores
+
+
+def build_tier_ids(store: CompactWordStore, scores) -> Tuple[Dict[str, array], Dict[str, Dict[str, List[int]]]]:
+    """Split each word length into score quantile tiers.
+
+    Returns:
+        Tuple of (mapping of tier to sorted array('I') of entry ids,
+        mapping of tier to {length: [lo, hi]} slice bounds into that array)
+    """
+    import numpy as np  # Build-time only; NumPy is not packaged with the Lambda
+
+    scores = np.asarray(scores)
+    tiers = np.empty(len(store), dtype=np.int64)
+    for start, end in (store.length_range(length) for length in store.lengths()):
+        # Rank within the length, then cut the ranks into equal-size quantiles
+        ranks = np.empty(end - start, dtype=np.int64)
+        ranks[np.argsort(scores[start:end], kind='stable')] = np.arange(end - start)
+        tiers[start:end] = ranks * len(DIFFICULTY_TIERS) // (end - start)
+
+    ids = {}
+    bounds = {}
+    for index, tier in enumerate(DIFFICULTY_TIERS):
+        members = np.flatnonzero(tiers == index)  # Already sorted by id
+        ids[tier] = array('I', members.tolist())
+        bounds[tier] = {
+            str(length): np.searchsorted(members, store.length_range(length)).tolist()
+            for length in store.lengths()
+        }
+    return ids, bounds
+
+
+def attach_difficulty(store: CompactWordStore, counts: Optional[Sequence[int]] = None) -> Dict[str, int]:
+    """Score a store's entries and attach the tier arrays so save() persists them.
+
+    Args:
+        store: Word store to score
+        counts: Lemma count per entry (default: looked up in WordNet)
+
+    Returns:
+        Mapping of tier name to number of member words
+    """
+    words = [store.word(entry_id) for entry_id in range(len(store))]
+    scores = compute_scores(words, lemma_counts(words) if counts is None else counts)
+    ids, bounds = build_tier_ids(store, scores)
+    for tier, values in ids.items():
+        store.arrays[ARRAY_PREFIX + tier] = values
+    store.metadata['difficulty'] = bounds
+    return {tier: len(values) for tier, values in ids.items()}
+
+
+def available_difficulties(store: Optional[CompactWordStore]) -> Tuple[str, ...]:
+    """Difficulty tiers present in a loaded store (empty if there is no store)."""
+    if store is None or 'difficulty' not in store.metadata:
+        return ()
+    return tuple(tier for tier in DIFFICULTY_TIERS if ARRAY_PREFIX + tier in store.arrays)
+
+
+def difficulty_id_range(store: CompactWordStore, difficulty: str, length: int) -> Tuple[array, int, int]:
+    """Look up the entries of one length in a difficulty tier.
+
+    Slice bounds are precomputed per length, so this is constant time.
+
+    Returns:
+        Tuple of (tier id array, lo, hi) where ids[lo:hi] are the tier's words
+        of the given length
+    """
+    lo, hi = store.metadata['difficulty'][difficulty].get(str(length), (0, 0))
+    return store.arrays[ARRAY_PREFIX + difficulty], lo, hi
+
@@ -2,22 +2,36 @@
 Hangman Word Generator Lambda Handler
 Generates random words using NLTK with profanity and distressing content filtering
 """
+import bisect
+import itertools
 import json
 import random
 import logging
+import time
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from nltk.corpus import wordnet as wn
 from better_profanity import profanity
 import nltk.data
 import os
 
+import runtime_stats
+from profiling import profile_request
+from seen_words import SeenWordsFilter
+from word_store import CompactWordStore
+from anagrams import AnagramIndex, MIN_LETTERS, MAX_LETTERS
+from categories import CATEGORY_ROOTS, available_categories, category_id_range
+from difficulty import DIFFICULTY_TIERS, available_difficulties, difficulty_id_range
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 # Initialize NLTK
 nltk.data.path.append(os.path.join(os.getcwd(), 'nltk_data'))
+_load_start = time.perf_counter()
 wn.ensure_loaded()
+runtime_stats.record_init('wordnet_load', time.perf_counter() - _load_start)
 
 # Distressing content filters (from wordsearch project)
 DISTRESSING_TERMS = [
@@ -33,6 +47,46 @@ DISTRESSING_DOMAINS = [
     '(military)', '(warfare)', '(slang)', '(vulgar)', '(offensive)'
 ]
 
+# Maximum number of words returned by a single batch request (?count=N)
+MAX_BATCH_SIZE = 10
+
+# Time budget for word generation. In Lambda the budget is the invocation's
+# remaining time minus a safety margin (capped by the SLO if one is set);
+# locally, where there is no context, the SLO alone applies.
+DEADLINE_SAFETY_MARGIN_MS = 500
+WORD_GENERATION_SLO_MS = int(os.environ.get('WORD_GENERATION_SLO_MS', '0') or 0)
+DEFAULT_LOCAL_BUDGET_MS = 10000
+
+
+# Prebuilt index of filtered words (see build_word_index.py). When packaged with
+# the function, words are sampled from it directly instead of filtered per request.
+WORD_INDEX_PATH = os.environ.get(
+    'WORD_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'word_index.bin'))
+
+# Default and maximum number of words returned by /anagrams and /subwords
+DEFAULT_LETTERS_LIMIT = 100
+MAX_LETTERS_LIMIT = 1000
+
+# Optional pool of pre-validated words (a word_pool.WordPool) installed by
+# long-running servers such as local_server.py; Lambda leaves it unset
+word_pool = None
+
+
+class WordIndexUnavailable(Exception):
+    """Raised when a category or difficulty tier is requested but the word index is not loaded."""
+
+
+class SeenWordsExhausted(Exception):
+    """Raised when every candidate word was ruled out and some only because the client had seen them."""
+
+
+class WordGenerationTimeout(Exception):
+    """Raised when no valid word is found within the time budget."""
+
+    def __init__(self, message: str, attempts: int):
+        super().__init__(message)
+        self.attempts = attempts
+
 
 def get_synset_for_word(word: str) -> Optional[Any]:
     """Get the best WordNet synset for a word, preferring noun definitions.
@@ -139,16 +193,206 @@ def is_word_valid(word: str, length: int) -> tuple[bool, Optional[str]]:
     return True, None
 
 
-def get_random_word(length: int = 5, max_attempts: int = 1000) -> Dict[str, Any]:
+def get_word_definitions(word: str) -> List[str]:
+    """Get all unique WordNet definitions for a word, in synset order.
+
+    Args:
+        word: The word to look up (case-insensitive)
+
+    Returns:
+        List of distinct definition strings (may be empty)
+
+    Example:
+        >>> get_word_definitions("elephant")
+        ['five-toed pachyderm', 'the symbol of the Republican Party; ...']
+    """
+    definitions = [s.definition() for s in wn.synsets(word.lower()) if s.definition()]
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(definitions))
+
+
+@lru_cache(maxsize=32)
+def get_words_of_length(length: int) -> tuple[str, ...]:
+    """Get all WordNet words of an exact length, cached per length.
+
+    Scanning wn.words() walks the whole corpus, so the per-length candidate
+    list is built once per warm Lambda container and reused by later requests.
+
+    Args:
+        length: Required exact length for the words
+
+    Returns:
+        Sorted tuple of lowercase candidate words (unfiltered)
+    """
+    words = tuple(sorted(w for w in wn.words() if len(w) == length))
+    runtime_stats.record_bucket_size('wordnet', length, len(words))
+    return words
+
+
+@lru_cache(maxsize=1)
+def get_word_store() -> Optional[CompactWordStore]:
+    """Load the prebuilt word index once per container, if it was packaged.
+
+    Returns:
+        The CompactWordStore at WORD_INDEX_PATH, or None if there is no index
+        (e.g. local development before running build_word_index.py)
+    """
+    if not os.path.exists(WORD_INDEX_PATH):
+        logger.info(f"No word index at {WORD_INDEX_PATH}; filtering WordNet per request")
+        return None
+
+    load_start = time.perf_counter()
+    store = CompactWordStore.load(WORD_INDEX_PATH)
+    runtime_stats.record_init('word_index_load', time.perf_counter() - load_start)
+    for length, size in store.lengths().items():
+        runtime_stats.record_bucket_size('word_index', length, size)
+    logger.info(f"Loaded word index with {len(store)} words ({store.nbytes() // 1024} KiB)")
+    return store
+
+
+@lru_cache(maxsize=1)
+def get_anagram_index() -> Optional[AnagramIndex]:
+    """Build the anagram/letter-multiset index from the word index once per container.
+
+    Returns:
+        AnagramIndex over the prefiltered words, or None if there is no word index
+    """
+    store = get_word_store()
+    if store is None:
+        return None
+
+    build_start = time.perf_counter()
+    index = AnagramIndex.build(store)
+    runtime_stats.record_init('anagram_index_build', time.perf_counter() - build_start)
+    logger.info(f"Built anagram index with {index.signature_count()} signatures")
+    return index
+
+
+def _check_deadline(deadline: Optional[float], start: float, attempt: int,
+                    filter_stats: Dict[str, int]) -> None:
+    """Raise WordGenerationTimeout if one more attempt, at the average cost so far, would overrun."""
+    if deadline is None:
+        return
+    now = time.monotonic()
+    average = (now - start) / attempt if attempt else 0.0
+    if now + average >= deadline:
+        logger.error(f"Deadline reached after {attempt} attempts")
+        logger.error(f"Filter statistics: {filter_stats}")
+        runtime_stats.record_filter_stats(filter_stats)
+        raise WordGenerationTimeout(
+            f"Could not find a valid word within the time budget ({attempt} attempts)", attempt)
+
+
+def _in_slice(ids, lo: int, hi: int, entry_id: int) -> bool:
+    """Check whether a sorted id slice ids[lo:hi] contains an entry id."""
+    position = bisect.bisect_left(ids, entry_id, lo, hi)
+    return position < hi and ids[position] == entry_id
+
+
+def _sample_from_store(store: CompactWordStore, length: int, max_attempts: Optional[int],
+                       seen: Optional[SeenWordsFilter], deadline: Optional[float],
+                       category: Optional[str] = None, difficulty: Optional[str] = None) -> Dict[str, Any]:
+    """Draw a random prefiltered word of the given length (category, difficulty) from the word index."""
+    start_id, end_id = store.length_range(length)
+    slices = []
+    if category is not None:
+        # Category ids are sorted, so the length range is one slice of them
+        slices.append(category_id_range(store, category, start_id, end_id))
+    if difficulty is not None:
+        slices.append(difficulty_id_range(store, difficulty, length))
+
+    if slices:
+        # Sample from the smallest slice and check membership of the others
+        slices.sort(key=lambda s: s[2] - s[1])
+        (ids, lo, hi), others = slices[0], slices[1:]
+    else:
+        ids, lo, hi, others = None, start_id, end_id, []
+
+    described = f"length {length}" + (f" in category '{category}'" if category else "")
+    described += f" at difficulty '{difficulty}'" if difficulty else ""
+    if lo == hi:
+        raise Exception(f"No words of {described} found in word index")
+
+    filter_stats = {'attempts': 0, 'already_seen': 0, 'filtered_out': 0}
+    attempts = range(max_attempts) if max_attempts is not None else itertools.count()
+    start = time.monotonic()
+    rejected = set()
+
+    for attempt in attempts:
+        _check_deadline(deadline, start, attempt, filter_stats)
+        if len(rejected) >= hi - lo:
+            runtime_stats.record_filter_stats(filter_stats)
+            if filter_stats['already_seen']:
+                raise SeenWordsExhausted(f"No unseen words of {described} available")
+            # Every candidate was outside the other slices: the intersection is empty
+            raise Exception(f"No words of {described} found in word index")
+
+        filter_stats['attempts'] += 1
+        position = random.randrange(lo, hi)
+        entry_id = ids[position] if ids is not None else position
+        if not all(_in_slice(*other, entry_id) for other in others):
+            filter_stats['filtered_out'] += 1
+            rejected.add(entry_id)
+            continue
+        if seen is not None and store.word(entry_id) in seen:
+            filter_stats['already_seen'] += 1
+            rejected.add(entry_id)
+            continue
+
+        logger.info(f"Picked indexed word after {attempt + 1} attempts: {filter_stats}")
+        runtime_stats.record_filter_stats(filter_stats)
+        return {**store[entry_id].to_dict(), 'attempts': attempt + 1}
+
+    runtime_stats.record_filter_stats(filter_stats)
+    # Only scan for an empty intersection once sampling has failed
+    if others and not any(all(_in_slice(*other, ids[position]) for other in others)
+                          for position in range(lo, hi)):
+        raise Exception(f"No words of {described} found in word index")
+    raise Exception(f"Could not find a valid word after {max_attempts} attempts")
+
+
+def has_words_of_length(length: int) -> bool:
+    """Check whether any candidate words of a length exist (index or WordNet)."""
+    store = get_word_store()
+    if store is not None:
+        start_id, end_id = store.length_range(length)
+        return end_id > start_id
+    return bool(get_words_of_length(length))
+
+
+@runtime_stats.timed('get_random_word')
+def get_random_word(length: int = 5, max_attempts: Optional[int] = 1000,
+                    seen: Optional[SeenWordsFilter] = None,
+                    deadline: Optional[float] = None,
+                    category: Optional[str] = None,
+                    difficulty: Optional[str] = None,
+                    use_pool: bool = True) -> Dict[str, Any]:
     """Generate a random word that passes all content and quality filters.
 
     Randomly selects words from the WordNet corpus and validates them against
-    all filters. Continues attempting until a valid word is found or max_attempts
-    is reached. Logs detailed statistics about filter rejections for debugging.
+    all filters. Continues attempting until a valid word is found, max_attempts
+    is reached, or the deadline would be missed. Logs detailed statistics about
+    filter rejections for debugging.
+
+    If a prebuilt word index is available (see get_word_store), words are drawn
+    from its already-filtered entries for the length instead. If a word pool
+    is installed (see word_pool), plain length requests are served from its
+    ready queue first.
 
     Args:
         length: Required exact length for the word (default: 5)
-        max_attempts: Maximum number of random words to try (default: 1000)
+        max_attempts: Maximum number of random words to try (default: 1000);
+            None means no attempt limit, so only the deadline bounds the search
+        seen: Optional filter of words already served to this client; matching
+            words are skipped so the client does not get repeats
+        deadline: Optional time.monotonic() value to finish by. The search stops
+            early when the next attempt would likely overrun it
+        category: Optional themed category (see categories.CATEGORY_ROOTS);
+            requires the prebuilt word index
+        difficulty: Optional difficulty tier (see difficulty.DIFFICULTY_TIERS);
+            requires the prebuilt word index
+        use_pool: Take a ready word from word_pool when one is installed
+            (default: True; the pool's own refills pass False)
 
     Returns:
         Dictionary containing:
@@ -158,6 +402,9 @@ def get_random_word(length: int = 5, max_attempts: int = 1000) -> Dict[str, Any]
         - attempts (int): Number of random words tried before finding this one
 
     Raises:
+        WordGenerationTimeout: If the deadline is reached before a valid word is found
+        SeenWordsExhausted: If every candidate was excluded, some because they were in `seen`
+        WordIndexUnavailable: If a category or difficulty is requested but no word index is loaded
         Exception: If no valid word is found after max_attempts tries
 
     Example:
@@ -170,8 +417,25 @@ def get_random_word(length: int = 5, max_attempts: int = 1000) -> Dict[str, Any]
             'attempts': 3
         }
     """
-    # Get all words from WordNet and pre-filter by length for efficiency
-    all_words = [w for w in wn.words() if len(w) == length]
+    # Only lengths with words get a pool queue, so bogus lengths can't use up its slots
+    if (use_pool and word_pool is not None and category is None and difficulty is None
+            and has_words_of_length(length)):
+        pooled = word_pool.take(length, seen)
+        if pooled is not None:
+            return pooled
+
+    store = get_word_store()
+    if category is not None and category not in available_categories(store):
+        # Closures are far too slow to compute per request, so there is no fallback
+        raise WordIndexUnavailable(f"Category '{category}' requires the prebuilt word index")
+    if difficulty is not None and difficulty not in available_difficulties(store):
+        raise WordIndexUnavailable(f"Difficulty '{difficulty}' requires the prebuilt word index")
+
+    if store is not None:
+        return _sample_from_store(store, length, max_attempts, seen, deadline, category, difficulty)
+
+    # Get all words from WordNet pre-filtered by length (cached per length)
+    all_words = get_words_of_length(length)
 
     if not all_words:
         raise Exception(f"No words of length {length} found in WordNet")
@@ -181,6 +445,7 @@ def get_random_word(length: int = 5, max_attempts: int = 1000) -> Dict[str, Any]
     # Filter statistics
     filter_stats = {
         'attempts': 0,
+        'already_seen': 0,
         'incorrect_length': 0,
         'invalid_characters': 0,
         'profanity_word': 0,
@@ -191,27 +456,43 @@ def get_random_word(length: int = 5, max_attempts: int = 1000) -> Dict[str, Any]
         'distressing_domain': 0
     }
 
-    for attempt in range(max_attempts):
+    attempts = range(max_attempts) if max_attempts is not None else itertools.count()
+    start = time.monotonic()
+    # Distinct words ruled out so far; once all are, further attempts are pointless
+    rejected = set()
+
+    for attempt in attempts:
+        _check_deadline(deadline, start, attempt, filter_stats)
+
+        if len(rejected) >= len(all_words):
+            logger.error(f"All {len(all_words)} words of length {length} rejected")
+            logger.error(f"Filter statistics: {filter_stats}")
+            runtime_stats.record_filter_stats(filter_stats)
+            if filter_stats['already_seen']:
+                raise SeenWordsExhausted(f"No unseen valid words of length {length} available")
+            raise Exception(f"No valid words of length {length} available")
+
         filter_stats['attempts'] += 1
         word = random.choice(all_words).lower()
 
+        # Already ruled out on an earlier attempt; don't re-run the filters
+        if word in rejected:
+            continue
+
+        if seen is not None and word in seen:
+            filter_stats['already_seen'] += 1
+            rejected.add(word)
+            continue
+
         is_valid, reason = is_word_valid(word, length)
 
         if is_valid:
-            # Get all definitions for the word
-            all_synsets = wn.synsets(word.lower())
-            definitions = [s.definition() for s in all_synsets if s.definition()]
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_definitions = []
-            for d in definitions:
-                if d not in seen:
-                    seen.add(d)
-                    unique_definitions.append(d)
+            unique_definitions = get_word_definitions(word)
 
             logger.info(f"Found valid word '{word}' after {attempt + 1} attempts")
             logger.info(f"Found {len(unique_definitions)} unique definitions")
             logger.info(f"Filter statistics: {filter_stats}")
+            runtime_stats.record_filter_stats(filter_stats)
 
             return {
                 'word': word.upper(),
@@ -220,14 +501,131 @@ def get_random_word(length: int = 5, max_attempts: int = 1000) -> Dict[str, Any]
                 'attempts': attempt + 1
             }
         else:
+            rejected.add(word)
             if reason:
                 filter_stats[reason] = filter_stats.get(reason, 0) + 1
 
     logger.error(f"Failed to find valid word after {max_attempts} attempts")
     logger.error(f"Filter statistics: {filter_stats}")
+    runtime_stats.record_filter_stats(filter_stats)
     raise Exception(f"Could not find a valid word after {max_attempts} attempts")
 
 
+@runtime_stats.timed('word_pool_refill')
+def refill_pool_word(length: int) -> Dict[str, Any]:
+    """Generate one word for a word_pool refill.
+
+    Recorded as word_pool_refill rather than get_random_word, so background
+    refills don't show up in request latency.
+
+    Example:
+        >>> pool = WordPool(refill_pool_word)
+    """
+    return get_random_word.__wrapped__(length, use_pool=False)
+
+
+def get_time_budget_ms(context) -> int:
+    """Work out how long word generation may run for this invocation.
+
+    In Lambda this is the remaining invocation time minus a safety margin, so a
+    timeout response can still be sent; WORD_GENERATION_SLO_MS caps it further
+    if set. Without a Lambda context (local server, tests) the SLO applies, or
+    DEFAULT_LOCAL_BUDGET_MS when no SLO is configured.
+
+    Args:
+        context: AWS Lambda context object, or None
+
+    Returns:
+        Time budget in milliseconds (never negative)
+    """
+    get_remaining = getattr(context, 'get_remaining_time_in_millis', None)
+    if get_remaining is None:
+        return WORD_GENERATION_SLO_MS or DEFAULT_LOCAL_BUDGET_MS
+
+    budget_ms = max(0, get_remaining() - DEADLINE_SAFETY_MARGIN_MS)
+    if WORD_GENERATION_SLO_MS:
+        budget_ms = min(budget_ms, WORD_GENERATION_SLO_MS)
+    return budget_ms
+
+
+def _json_response(status_code: int, body: Dict[str, Any],
+                   headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Build an API Gateway proxy response with JSON body and CORS headers."""
+    return {
+        'statusCode': status_code,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*',
+            **(headers or {})
+        },
+        'body': json.dumps(body)
+    }
+
+
+def _letters_response(route: str, params: Dict[str, str]) -> Dict[str, Any]:
+    """Answer an /anagrams or /subwords request from the anagram index.
+
+    Query Parameters:
+        letters (str): Letters to rearrange (3 to 16 of A-Z)
+        min_length (int, optional): Shortest word to return, /subwords only (3 to 16, default: 3)
+        limit (int, optional): Maximum words returned (default: 100, max: 1000)
+    """
+    start = time.perf_counter()
+    try:
+        letters = params.get('letters') or ''
+        min_length = int(params.get('min_length', MIN_LETTERS))
+        if not MIN_LETTERS <= min_length <= MAX_LETTERS:
+            return _json_response(400, {'error': f'min_length must be between {MIN_LETTERS} and {MAX_LETTERS}'})
+        limit = int(params.get('limit', DEFAULT_LETTERS_LIMIT))
+        if not 1 <= limit <= MAX_LETTERS_LIMIT:
+            return _json_response(400, {'error': f'limit must be between 1 and {MAX_LETTERS_LIMIT}'})
+
+        index = get_anagram_index()
+        if index is None:
+            return _json_response(503, {
+                'error': 'Word index is not available',
+                'message': f"/{route} requires the prebuilt word index"
+            })
+
+        words = index.anagrams(letters) if route == 'anagrams' else index.subwords(letters, min_length)
+    except ValueError as e:
+        return _json_response(400, {'error': f'Invalid parameter: {str(e)}'})
+
+    return _json_response(200, {
+        'letters': letters.strip().upper(),
+        'words': words[:limit],
+        'count': len(words),
+        'truncated': len(words) > limit,
+        'elapsed_ms': round((time.perf_counter() - start) * 1000, 3)
+    })
+
+
+def get_runtime_stats() -> Dict[str, Any]:
+    """Collect runtime statistics for this process (or warm Lambda container).
+
+    Everything reported is recorded as requests run (see runtime_stats), so
+    reading it is cheap and does not touch WordNet or load the word index.
+
+    Returns:
+        Dictionary containing:
+        - latency: Rolling get_random_word latency percentiles
+        - filter_stats: Attempts and rejections by filter reason since startup
+        - bucket_sizes: Words per length in the word index, or WordNet
+          candidates per cached length when filtering per request
+        - caches: Hit rates and evictions of the per-container caches
+        - init_ms: Init-phase timings (WordNet load, word index load)
+        - memory: Current and peak RSS in MB
+    """
+    stats = runtime_stats.snapshot()
+    stats['caches'] = {
+        'words_of_length': runtime_stats.cache_summary(get_words_of_length),
+        'word_store': runtime_stats.cache_summary(get_word_store),
+        'anagram_index': runtime_stats.cache_summary(get_anagram_index),
+    }
+    return stats
+
+
+@profile_request
 def lambda_handler(event, context):
     """AWS Lambda handler function for the Hangman Word Generator API.
 
@@ -235,14 +633,25 @@ def lambda_handler(event, context):
     events, validates parameters, generates filtered words, and returns properly
     formatted HTTP responses with CORS headers.
 
+    Requests can be sampled for profiling via the PROFILE_* environment
+    variables (see profiling.load_config); this is off by default.
+
+    GET /anagrams and GET /subwords requests (by rawPath) are answered from
+    the anagram index instead; see _letters_response.
+
+    A direct invocation (not through API Gateway) with {"action": "stats"}
+    logs and returns get_runtime_stats() for the container that served it.
+
     Args:
         event: AWS Lambda event object containing:
-            - queryStringParameters: Dict with optional 'length' parameter
-        context: AWS Lambda context object (unused but required by Lambda)
+            - queryStringParameters: Dict with optional 'length', 'count', 'category',
+              'difficulty' and 'seen' parameters
+        context: AWS Lambda context object; get_remaining_time_in_millis()
+            sets the time budget for word generation (None when run locally)
 
     Returns:
         Dictionary with HTTP response format:
-        - statusCode (int): HTTP status code (200, 400, or 500)
+        - statusCode (int): HTTP status code (200, 400, 500, or 503)
         - headers (dict): Response headers including CORS
         - body (str): JSON string with result or error
 
@@ -252,7 +661,19 @@ def lambda_handler(event, context):
                 "word": "ELEPHANT",
                 "length": 8,
                 "definition": "five-toed pachyderm",
-                "attempts": 3
+                "attempts": 3,
+                "seen": "eNpjZGBkIBIwEaOIGNMaiDHIgWEU0AcAAC15AMY",
+                "budget_ms": 29500,
+                "elapsed_ms": 4.2
+            }
+
+        Batch Success (200, when 'count' is given):
+            {
+                "words": [{"word": "ELEPHANT", ...}, {"word": "MOUNTAIN", ...}],
+                "seen": "eNpjZGBkIBIwEaOIGNMaiDHIgWEU0AcAAC15AMY",
+                "partial": false,
+                "budget_ms": 29500,
+                "elapsed_ms": 9.8
             }
 
         Bad Request (400):
@@ -263,11 +684,33 @@ def lambda_handler(event, context):
         Server Error (500):
             {
                 "error": "Failed to generate word",
-                "message": "Could not find a valid word after 1000 attempts"
+                "message": "No words of length 40 found in WordNet"
+            }
+
+        Service Unavailable (503, category or difficulty requested without a word index):
+            {
+                "error": "Word index is not available",
+                "message": "Category 'animals' requires the prebuilt word index"
+            }
+
+        Service Unavailable (503, time budget exhausted before any word was found):
+            {
+                "error": "Word generation timed out",
+                "message": "Could not find a valid word within the time budget (812 attempts)",
+                "budget_ms": 2000,
+                "elapsed_ms": 1998.7
             }
 
     Query Parameters:
         length (int, optional): Exact word length (minimum: 3, default: 5)
+        count (int, optional): Return a batch of this many distinct words
+            (1 to MAX_BATCH_SIZE) under a 'words' key
+        category (str, optional): Themed category, one of CATEGORY_ROOTS
+            ('animals', 'food', 'places'); served from the word index
+        difficulty (str, optional): Difficulty tier, one of DIFFICULTY_TIERS
+            ('easy', 'medium', 'hard'); served from the word index
+        seen (str, optional): Token from a previous response; words already
+            served to this client are excluded and an updated token is returned
 
     Example:
         >>> event = {'queryStringParameters': {'length': '8'}}
@@ -275,61 +718,111 @@ def lambda_handler(event, context):
         >>> response['statusCode']
         200
     """
+    # Direct invocations carry no requestContext, so API clients cannot reach this
+    if event and event.get('action') == 'stats' and 'requestContext' not in event:
+        stats = get_runtime_stats()
+        logger.info(json.dumps({'event': 'runtime_stats', **stats}))
+        return stats
+
+    # GET /anagrams and /subwords share the function with GET /word
+    route = (event or {}).get('rawPath', '').rstrip('/').rsplit('/', 1)[-1]
+    if route in ('anagrams', 'subwords'):
+        return _letters_response(route, event.get('queryStringParameters') or {})
+
+    start = time.monotonic()
+    budget_ms = get_time_budget_ms(context)
+    deadline = start + budget_ms / 1000
+
     try:
         # Parse query parameters
         params = event.get('queryStringParameters') or {}
         length = int(params.get('length', 5))
+        count = int(params['count']) if params.get('count') else None
+        category = params.get('category') or None
+        difficulty = params.get('difficulty') or None
+        seen_token = params.get('seen')
+        seen = SeenWordsFilter.from_token(seen_token) if seen_token else SeenWordsFilter()
+        # Keep the false-positive rate bounded for long-lived clients
+        if seen.rotate_if_saturated():
+            logger.info("Seen token saturated; starting a fresh one")
 
         # Validate parameters
         if length < 3:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'length must be at least 3'
-                })
-            }
-
-        logger.info(f"Generating word with length={length}")
+            return _json_response(400, {'error': 'length must be at least 3'})
+
+        if count is not None and not 1 <= count <= MAX_BATCH_SIZE:
+            return _json_response(400, {'error': f'count must be between 1 and {MAX_BATCH_SIZE}'})
+
+        if category is not None and category not in CATEGORY_ROOTS:
+            return _json_response(400, {'error': f"category must be one of: {', '.join(sorted(CATEGORY_ROOTS))}"})
+
+        if difficulty is not None and difficulty not in DIFFICULTY_TIERS:
+            return _json_response(400, {'error': f"difficulty must be one of: {', '.join(DIFFICULTY_TIERS)}"})
+
+        logger.info(f"Generating {count or 1} word(s) with length={length} category={category} "
+                    f"difficulty={difficulty} within {budget_ms}ms")
+
+        # Generate words; each one joins the seen filter so a batch has no duplicates
+        words = []
+        try:
+            for _ in range(count or 1):
+                try:
+                    result = get_random_word(length, max_attempts=None, seen=seen, deadline=deadline,
+                                             category=category, difficulty=difficulty)
+                except SeenWordsExhausted as e:
+                    # The client has seen every word available; start a fresh token
+                    # (keeping this batch) instead of failing every later request
+                    logger.warning(f"{str(e)}; starting a fresh seen token")
+                    seen = SeenWordsFilter()
+                    for word in words:
+                        seen.add(word['word'])
+                    result = get_random_word(length, max_attempts=None, seen=seen, deadline=deadline,
+                                             category=category, difficulty=difficulty)
+                seen.add(result['word'])
+                words.append(result)
+        except (WordGenerationTimeout, SeenWordsExhausted) as e:
+            # A partial batch is still useful; a single word is not available
+            if not words:
+                raise
+            logger.warning(f"Returning {len(words)} of {count} words: {str(e)}")
+
+        budget = {
+            'budget_ms': budget_ms,
+            'elapsed_ms': round((time.monotonic() - start) * 1000, 1)
+        }
 
-        # Generate word
-        result = get_random_word(length)
+        # Return the updated token so the client does not get these words again
+        if count is None:
+            body = {**words[0], 'seen': seen.to_token(), **budget}
+        else:
+            body = {'words': words, 'seen': seen.to_token(), 'partial': len(words) < count, **budget}
 
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps(result)
-        }
+        return _json_response(200, body)
 
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
-        return {
-            'statusCode': 400,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': f'Invalid parameter: {str(e)}'
-            })
-        }
+        return _json_response(400, {'error': f'Invalid parameter: {str(e)}'})
+
+    except WordIndexUnavailable as e:
+        logger.error(str(e))
+        return _json_response(503, {
+            'error': 'Word index is not available',
+            'message': str(e)
+        })
+
+    except WordGenerationTimeout as e:
+        elapsed_ms = round((time.monotonic() - start) * 1000, 1)
+        logger.error(f"Word generation timed out after {elapsed_ms}ms of {budget_ms}ms: {str(e)}")
+        return _json_response(503, {
+            'error': 'Word generation timed out',
+            'message': str(e),
+            'budget_ms': budget_ms,
+            'elapsed_ms': elapsed_ms
+        }, {'Retry-After': '1'})
 
     except Exception as e:
         logger.error(f"Error generating word: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': 'Failed to generate word',
-                'message': str(e)
-            })
-        }
+        return _json_response(500, {
+            'error': 'Failed to generate word',
+            'message': str(e)
+        })
@@ -0,0 +1,151 @@
+"""
+Opt-in per-request profiling for the Lambda handler
+Samples 1-in-N requests with cProfile (and optionally tracemalloc) and logs the hot spots
+"""
+import cProfile
+import functools
+import itertools
+import json
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+def load_config(environ: Mapping[str, str] = os.environ) -> Dict[str, Any]:
+    """Read profiling settings from environment variables.
+
+    Environment Variables:
+        PROFILE_SAMPLE_RATE: Profile 1 in N requests (default: 0, disabled)
+        PROFILE_TRACEMALLOC: 'true' to also record allocation sites (default: false)
+        PROFILE_TOP_N: Number of functions/allocation sites to report (default: 15)
+        PROFILE_SORT: 'tottime' or 'cumulative' ordering for functions (default: tottime)
+        PROFILE_QUERY_FLAG: 'true' to let '?profile=1' force profiling of a request
+            (default: false, so clients cannot trigger profiling in production)
+
+    Returns:
+        Dictionary of parsed settings
+    """
+    sort = environ.get('PROFILE_SORT', 'tottime')
+    return {
+        'sample_rate': int(environ.get('PROFILE_SAMPLE_RATE', '0') or 0),
+        'tracemalloc': environ.get('PROFILE_TRACEMALLOC', '').lower() == 'true',
+        'top_n': int(environ.get('PROFILE_TOP_N', '15') or 15),
+        'sort': sort if sort in ('tottime', 'cumulative') else 'tottime',
+        'query_flag': environ.get('PROFILE_QUERY_FLAG', '').lower() == 'true',
+    }
+
+
+PROFILE_CONFIG = load_config()
+
+_request_counter = itertools.count(1)
+
+
+def _should_profile(event: Dict[str, Any]) -> bool:
+    """Decide whether this request is sampled."""
+    config = PROFILE_CONFIG
+    if config['query_flag']:
+        params = event.get('queryStringParameters') or {}
+        if params.get('profile') in ('1', 'true'):
+            return True
+    rate = config['sample_rate']
+    return rate > 0 and next(_request_counter) % rate == 0
+
+
+def _top_functions(profiler: cProfile.Profile, top_n: int, sort: str) -> List[Dict[str, Any]]:
+    """Summarize the most expensive functions from a cProfile run."""
+    stats = pstats.Stats(profiler).stats
+    key = 3 if sort == 'cumulative' else 2
+    rows = sorted(stats.items(), key=lambda item: item[1][key], reverse=True)[:top_n]
+    return [
+        {
+            'function': func,
+            'file': f"{os.path.basename(filename)}:{line}",
+            'ncalls': ncalls,
+            'tottime_ms': round(tottime * 1000, 3),
+            'cumtime_ms': round(cumtime * 1000, 3),
+        }
+        for (filename, line, func), (_, ncalls, tottime, cumtime, _) in rows
+    ]
+
+
+def _top_allocations(snapshot: tracemalloc.Snapshot, top_n: int) -> List[Dict[str, Any]]:
+    """Summarize the largest allocation sites from a tracemalloc snapshot."""
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    return [
+        {
+            'site': f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+            'size_kb': round(stat.size / 1024, 2),
+            'count': stat.count,
+        }
+        for stat in snapshot.statistics('lineno')[:top_n]
+    ]
+
+
+def profile_request(func: Callable) -> Callable:
+    """Decorate a Lambda handler so sampled requests are profiled.
+
+    Unsampled requests only pay for a config lookup and a counter increment.
+    Sampled requests run under cProfile (and tracemalloc if enabled) and emit a
+    single structured 'request_profile' JSON log record with the top functions
+    and allocation sites.
+
+    cProfile allows one active profiler at a time, so when requests overlap
+    (threaded local_server.py) a sampled request that cannot attach a profiler
+    simply runs unprofiled. tracemalloc is process-wide, so concurrent requests
+    can show up in each other's allocation sites.
+
+    Example:
+        >>> @profile_request
+        ... def lambda_handler(event, context):
+        ...     return {'statusCode': 200}
+    """
+    @functools.wraps(func)
+    def wrapper(event, context):
+        if not _should_profile(event or {}):
+            return func(event, context)
+
+        config = PROFILE_CONFIG
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active (overlapping sampled request)
+            return func(event, context)
+
+        started_tracemalloc = config['tracemalloc'] and not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        try:
+            response = func(event, context)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot() if config['tracemalloc'] and tracemalloc.is_tracing() else None
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+        record = {
+            'event': 'request_profile',
+            'request_id': getattr(context, 'aws_request_id', None),
+            'query': (event or {}).get('queryStringParameters'),
+            'status_code': response.get('statusCode') if isinstance(response, dict) else None,
+            'duration_ms': round(duration_ms, 3),
+            'top_functions': _top_functions(profiler, config['top_n'], config['sort']),
+        }
+        if snapshot is not None:
+            record['top_allocations'] = _top_allocations(snapshot, config['top_n'])
+
+        logger.info(json.dumps(record))
+        return response
+
+    return wrapper
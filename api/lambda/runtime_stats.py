@@ -0,0 +1,134 @@
+"""
+Cheap always-on runtime statistics for the word generator
+Records latencies, filter statistics and init timings without locks, for /stats and on-demand logging
+"""
+import collections
+import functools
+import os
+import resource
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Number of recent calls kept per timed function for the rolling percentiles
+LATENCY_WINDOW = 1024
+
+PERCENTILES = (50, 90, 99)
+
+# All recorders below rely on single operations that are atomic under the GIL
+# (deque.append, dict item assignment), so they never take a lock. Counter
+# increments from concurrent threads can occasionally be lost, which is fine
+# for monitoring.
+_latencies: Dict[str, collections.deque] = collections.defaultdict(
+    lambda: collections.deque(maxlen=LATENCY_WINDOW))
+_call_counts: Dict[str, int] = collections.Counter()
+_filter_totals: Dict[str, int] = collections.Counter()
+_init_timings: Dict[str, float] = {}
+_bucket_sizes: Dict[str, Dict[int, int]] = collections.defaultdict(dict)
+
+
+def record_init(phase: str, seconds: float) -> None:
+    """Record how long an initialization phase (import, index load, ...) took."""
+    _init_timings[phase] = round(seconds * 1000, 3)
+
+
+def record_latency(name: str, seconds: float) -> None:
+    """Add one call duration to the rolling window for `name`."""
+    _latencies[name].append(seconds * 1000)
+    _call_counts[name] += 1
+
+
+def record_filter_stats(filter_stats: Dict[str, int]) -> None:
+    """Add one search's filter statistics (attempts and rejections by reason) to the running totals."""
+    for reason, count in filter_stats.items():
+        if count:
+            _filter_totals[reason] += count
+
+
+def record_bucket_size(source: str, length: int, size: int) -> None:
+    """Record the number of words available for a word length from a source."""
+    _bucket_sizes[source][length] = size
+
+
+def timed(name: str) -> Callable:
+    """Decorate a function so every call's duration is recorded under `name`.
+
+    Example:
+        >>> @timed('get_random_word')
+        ... def get_random_word(length=5):
+        ...     ...
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_latency(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def latency_summary(name: str) -> Optional[Dict[str, Any]]:
+    """Summarize the rolling latency window for `name` (None if never called)."""
+    window = sorted(tuple(_latencies.get(name, ())))  # tuple() copies the deque in one step
+    if not window:
+        return None
+    summary: Dict[str, Any] = {'calls': _call_counts[name], 'window': len(window)}
+    for percentile in PERCENTILES:
+        index = min(len(window) - 1, len(window) * percentile // 100)
+        summary[f'p{percentile}_ms'] = round(window[index], 3)
+    summary['max_ms'] = round(window[-1], 3)
+    return summary
+
+
+def cache_summary(cached: Callable) -> Dict[str, Any]:
+    """Summarize an lru_cache-decorated function's hit rate and evictions."""
+    info = cached.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': round(info.hits / lookups, 4) if lookups else None,
+        'size': info.currsize,
+        'max_size': info.maxsize,
+        # Every miss inserts an entry, so misses beyond the current size were evicted
+        'evictions': max(0, info.misses - info.currsize),
+    }
+
+
+def memory_summary() -> Dict[str, Any]:
+    """Current and peak resident set size of this process in MB."""
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak_kb //= 1024  # Reported in bytes on macOS
+    summary: Dict[str, Any] = {'rss_mb': None, 'max_rss_mb': round(peak_kb / 1024, 1)}
+    try:
+        with open('/proc/self/statm') as f:
+            rss_pages = int(f.read().split()[1])
+        summary['rss_mb'] = round(rss_pages * os.sysconf('SC_PAGE_SIZE') / 2**20, 1)
+    except (OSError, ValueError):
+        pass
+    return summary
+
+
+def snapshot() -> Dict[str, Any]:
+    """Collect the recorded statistics into a JSON-serializable dict."""
+    return {
+        'latency': {name: latency_summary(name) for name in list(_latencies)},
+        'filter_stats': dict(_filter_totals),
+        'bucket_sizes': {
+            source: {str(length): size for length, size in sorted(sizes.items())}
+            for source, sizes in list(_bucket_sizes.items())
+        },
+        'init_ms': dict(_init_timings),
+        'memory': memory_summary(),
+    }
+
+
+def reset() -> None:
+    """Clear recorded latencies and counters (init timings are kept)."""
+    _latencies.clear()
+    _call_counts.clear()
+    _filter_totals.clear()
@@ -0,0 +1,105 @@
+"""
+Compact "already served" word tokens for per-client no-repeat guarantees
+Encodes a fixed-size Bloom filter as an opaque URL-safe token the client round-trips
+"""
+import base64
+import hashlib
+import zlib
+from typing import Optional
+
+# Token layout: 1 version byte + 2 byte served count + bit array, zlib-compressed
+TOKEN_VERSION = 1
+BLOOM_BITS = 4096
+BLOOM_HASHES = 4
+MAX_TOKEN_LENGTH = 2048
+
+# Share of bits set at which the filter is started afresh. With 4 hashes the
+# false-positive rate is about fill ** 4, so this keeps it under 2% (roughly
+# 480 words); older words may then repeat, which beats excluding everything.
+MAX_FILL_RATIO = 0.375
+
+
+class SeenWordsFilter:
+    """Bloom filter over words already served to a single client.
+
+    The filter has a fixed size, so the token stays bounded no matter how many
+    games a client plays. Bloom filters never give false negatives: a word that
+    was served is always excluded. False positives only mean a handful of unseen
+    words are skipped, which is harmless when sampling from thousands of
+    candidates (roughly 0.5% of words after 300 games). Once the filter is
+    saturated (see MAX_FILL_RATIO) rotate_if_saturated() clears it, so the
+    false-positive rate stays bounded however long a client plays.
+
+    Words are hashed by their lowercase text rather than by position in the
+    WordNet word list, so tokens stay valid across corpus or index rebuilds.
+
+    Example:
+        >>> seen = SeenWordsFilter()
+        >>> seen.add("elephant")
+        >>> "ELEPHANT" in seen
+        True
+        >>> SeenWordsFilter.from_token(seen.to_token()).count
+        1
+    """
+
+    __slots__ = ('bits', 'count')
+
+    def __init__(self, bits: Optional[bytearray] = None, count: int = 0):
+        self.bits = bits if bits is not None else bytearray(BLOOM_BITS // 8)
+        self.count = count
+
+    @staticmethod
+    def _positions(word: str):
+        digest = hashlib.blake2b(word.lower().encode('utf-8'), digest_size=16).digest()
+        # Kirsch-Mitzenmacher double hashing: k positions from two 64-bit hashes
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % BLOOM_BITS for i in range(BLOOM_HASHES)]
+
+    def add(self, word: str) -> None:
+        """Mark a word as served to this client."""
+        for pos in self._positions(word):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count = min(self.count + 1, 0xFFFF)
+
+    def fill_ratio(self) -> float:
+        """Share of filter bits that are set."""
+        return int.from_bytes(self.bits, 'little').bit_count() / BLOOM_BITS
+
+    def rotate_if_saturated(self) -> bool:
+        """Clear the filter if too many bits are set, returning True if it was cleared."""
+        if self.fill_ratio() < MAX_FILL_RATIO:
+            return False
+        self.bits = bytearray(BLOOM_BITS // 8)
+        self.count = 0
+        return True
+
+    def __contains__(self, word: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(word))
+
+    def to_token(self) -> str:
+        """Serialize the filter to an opaque, URL-safe token."""
+        raw = bytes([TOKEN_VERSION]) + self.count.to_bytes(2, 'big') + bytes(self.bits)
+        return base64.urlsafe_b64encode(zlib.compress(raw, 9)).decode('ascii').rstrip('=')
+
+    @classmethod
+    def from_token(cls, token: str) -> 'SeenWordsFilter':
+        """Deserialize a token produced by to_token().
+
+        Raises:
+            ValueError: If the token is oversized, corrupt, or from an unknown version
+        """
+        if len(token) > MAX_TOKEN_LENGTH:
+            raise ValueError('seen token is too long')
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            # Bound decompression so a crafted token cannot expand unboundedly
+            decompressor = zlib.decompressobj()
+            raw = decompressor.decompress(base64.urlsafe_b64decode(padded), 3 + BLOOM_BITS // 8 + 1)
+        except (ValueError, zlib.error) as e:
+            raise ValueError('seen token is malformed') from e
+
+        if len(raw) != 3 + BLOOM_BITS // 8 or raw[0] != TOKEN_VERSION:
+            raise ValueError('seen token is malformed')
+
+        return cls(bytearray(raw[3:]), int.from_bytes(raw[1:3], 'big'))
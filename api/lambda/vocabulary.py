@@ -0,0 +1,95 @@
+"""
+Streaming export of the filtered Hangman vocabulary
+Generator pipeline: WordNet words -> length filter -> content filters -> NDJSON -> optional gzip
+"""
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from nltk.corpus import wordnet as wn
+
+from handler import get_word_definitions, is_word_valid
+
+MIN_WORD_LENGTH = 3
+
+
+def validate_length_range(min_length: int, max_length: Optional[int]) -> None:
+    """Check an export length range.
+
+    Raises:
+        ValueError: If min_length is below 3 or max_length is below min_length
+    """
+    if min_length < MIN_WORD_LENGTH:
+        raise ValueError(f'min_length must be at least {MIN_WORD_LENGTH}')
+    if max_length is not None and max_length < min_length:
+        raise ValueError('max_length must be greater than or equal to min_length')
+
+
+def iter_candidate_words(min_length: int = MIN_WORD_LENGTH, max_length: Optional[int] = None) -> Iterator[str]:
+    """Yield lowercase WordNet words within a length range (unfiltered).
+
+    Streams straight from wn.words() without materializing a list.
+    """
+    for word in wn.words():
+        if len(word) >= min_length and (max_length is None or len(word) <= max_length):
+            yield word.lower()
+
+
+def iter_valid_entries(words: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield word entries for the words that pass all content filters.
+
+    Entries match the single-word API response fields:
+    {'word': 'ELEPHANT', 'length': 8, 'definitions': [...]}
+    """
+    for word in words:
+        is_valid, _ = is_word_valid(word, len(word))
+        if is_valid:
+            yield {
+                'word': word.upper(),
+                'length': len(word),
+                'definitions': get_word_definitions(word),
+            }
+
+
+def iter_ndjson(entries: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode entries as newline-delimited JSON, one line per entry."""
+    for entry in entries:
+        yield (json.dumps(entry) + '\n').encode('utf-8')
+
+
+def iter_gzip(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip-compress a byte stream incrementally."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 writes a gzip header
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_vocabulary(min_length: int = MIN_WORD_LENGTH, max_length: Optional[int] = None,
+                      compress: bool = False) -> Iterator[bytes]:
+    """Stream the filtered vocabulary as NDJSON bytes, optionally gzipped.
+
+    Memory use is constant regardless of corpus size: each stage is a generator
+    and only one entry is in flight at a time.
+
+    Args:
+        min_length: Minimum word length, inclusive (default: 3)
+        max_length: Maximum word length, inclusive (default: no limit)
+        compress: Gzip the output stream
+
+    Returns:
+        Iterator of byte chunks
+
+    Raises:
+        ValueError: If the length range is invalid
+
+    Example:
+        >>> with open('words.ndjson.gz', 'wb') as f:
+        ...     for chunk in export_vocabulary(5, 8, compress=True):
+        ...         f.write(chunk)
+    """
+    validate_length_range(min_length, max_length)
+    stream = iter_ndjson(iter_valid_entries(iter_candidate_words(min_length, max_length)))
+    return iter_gzip(stream) if compress else stream
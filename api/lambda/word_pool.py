@@ -0,0 +1,186 @@
+"""
+Background-refilled pools of pre-validated words for long-running servers
+A worker thread keeps a bounded ready queue per requested length so requests pop instead of filtering
+"""
+import collections
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queues are refilled up to the high watermark once they drop below the low one
+DEFAULT_LOW_WATERMARK = 4
+DEFAULT_HIGH_WATERMARK = 16
+
+# Upper bound on the number of distinct lengths given a queue
+DEFAULT_MAX_LENGTHS = 32
+
+_STOP = object()
+
+
+class _LengthPool:
+    """Ready queue and counters for one word length."""
+
+    __slots__ = ('words', 'hits', 'misses', 'refills', 'requested_at', 'last_lag_ms', 'max_lag_ms', 'failed')
+
+    def __init__(self, capacity: int):
+        # deque.append/popleft are atomic, so the worker and request threads
+        # share it without a lock; maxlen is a hard bound on the queue
+        self.words: collections.deque = collections.deque(maxlen=capacity)
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.requested_at: Optional[float] = None
+        self.last_lag_ms: Optional[float] = None
+        self.max_lag_ms: Optional[float] = None
+        self.failed = False
+
+
+class WordPool:
+    """Ready queues of pre-validated words, refilled by a background thread.
+
+    Queues are created on demand the first time a length is requested, so
+    callers should only ask for lengths that have words. When
+    a take() leaves a queue below the low watermark, the length is handed to
+    the worker, which generates words until the queue reaches the high
+    watermark. Refill lag is the time from that request to the queue being
+    full again. take() never blocks: if the queue has no suitable word it
+    returns None and the caller generates one inline.
+
+    The worker is a daemon thread started on first use; call stop() on
+    shutdown to let it finish the current word and exit.
+
+    Args:
+        generate: Function taking a length and returning a word result dict
+            (must not itself draw from this pool)
+        low_watermark: Refill when a queue drops below this many words
+        high_watermark: Refill up to this many words (queue capacity)
+        max_lengths: Maximum number of lengths with a queue (queues whose
+            refill failed don't count)
+
+    Example:
+        >>> pool = WordPool(refill_pool_word)
+        >>> pool.take(5)  # None until the worker has filled the queue
+        >>> pool.stop()
+    """
+
+    def __init__(self, generate: Callable[[int], Dict[str, Any]],
+                 low_watermark: int = DEFAULT_LOW_WATERMARK,
+                 high_watermark: int = DEFAULT_HIGH_WATERMARK,
+                 max_lengths: int = DEFAULT_MAX_LENGTHS):
+        if not 0 < low_watermark <= high_watermark:
+            raise ValueError('watermarks must satisfy 0 < low_watermark <= high_watermark')
+        self._generate = generate
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.max_lengths = max_lengths
+        self._pools: Dict[int, _LengthPool] = {}
+        self._failed_count = 0
+        self._requests: queue.Queue = queue.Queue()
+        self._stopping = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def take(self, length: int, seen=None) -> Optional[Dict[str, Any]]:
+        """Pop a ready word of the given length, or None if there isn't one.
+
+        Words in `seen` are skipped and put back for other clients.
+        """
+        pool = self._pools.get(length)
+        if pool is None:
+            if len(self._pools) - self._failed_count >= self.max_lengths or self._stopping.is_set():
+                return None
+            pool = self._pools.setdefault(length, _LengthPool(self.high_watermark))
+
+        result = None
+        for _ in range(len(pool.words)):
+            try:
+                candidate = pool.words.popleft()
+            except IndexError:
+                break
+            if seen is not None and candidate['word'] in seen:
+                pool.words.append(candidate)
+                continue
+            result = candidate
+            break
+
+        if result is None:
+            pool.misses += 1
+        else:
+            pool.hits += 1
+        if len(pool.words) < self.low_watermark:
+            self._request_refill(length, pool)
+        return result
+
+    def _request_refill(self, length: int, pool: _LengthPool) -> None:
+        if pool.failed or pool.requested_at is not None or self._stopping.is_set():
+            return
+        pool.requested_at = time.monotonic()
+        self._ensure_started()
+        self._requests.put(length)
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='word-pool-refill', daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            length = self._requests.get()
+            if length is _STOP:
+                return
+            self._refill(length, self._pools[length])
+
+    def _refill(self, length: int, pool: _LengthPool) -> None:
+        while len(pool.words) < self.high_watermark and not self._stopping.is_set():
+            try:
+                result = self._generate(length)
+            except Exception as e:
+                # e.g. no valid words of this length; stop trying so misses stay cheap
+                logger.warning(f"Word pool refill for length {length} failed: {str(e)}")
+                pool.failed = True
+                self._failed_count += 1
+                break
+            pool.words.append(result)
+
+        lag_ms = round((time.monotonic() - pool.requested_at) * 1000, 3)
+        pool.last_lag_ms = lag_ms
+        pool.max_lag_ms = max(pool.max_lag_ms or 0.0, lag_ms)
+        pool.refills += 1
+        pool.requested_at = None
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the worker after the word it is generating, and wait for it."""
+        self._stopping.set()
+        self._requests.put(_STOP)
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, hit rate and refill lag per length."""
+        lengths = {}
+        for length, pool in sorted(list(self._pools.items())):
+            lookups = pool.hits + pool.misses
+            pending = pool.requested_at
+            lengths[str(length)] = {
+                'depth': len(pool.words),
+                'hits': pool.hits,
+                'misses': pool.misses,
+                'hit_rate': round(pool.hits / lookups, 4) if lookups else None,
+                'refills': pool.refills,
+                'refill_pending_ms': round((time.monotonic() - pending) * 1000, 3) if pending is not None else None,
+                'last_refill_lag_ms': pool.last_lag_ms,
+                'max_refill_lag_ms': pool.max_lag_ms,
+                'failed': pool.failed,
+            }
+        return {
+            'running': self._thread is not None and self._thread.is_alive(),
+            'low_watermark': self.low_watermark,
+            'high_watermark': self.high_watermark,
+            'lengths': lengths,
+        }
@@ -0,0 +1,242 @@
+"""
+Compact, array-backed storage for the filtered word vocabulary
+Packs words and deduplicated definitions into flat buffers indexed by array('I') offsets
+"""
+import json
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# File layout: MAGIC, 4-byte little-endian header length, JSON header, then the
+# sections listed in the header in order (little-endian uint32 arrays or raw bytes)
+MAGIC = b'HWIX'
+FORMAT_VERSION = 1
+
+
+def _uint32_array(values: Iterable[int] = ()) -> array:
+    return array('I', values)
+
+
+class WordEntry:
+    """Lightweight view of one entry in a CompactWordStore.
+
+    Views are created on access and hold only the store and an entry id, so
+    nothing is duplicated per entry until a field is read.
+    """
+
+    __slots__ = ('_store', 'id')
+
+    def __init__(self, store: 'CompactWordStore', entry_id: int):
+        self._store = store
+        self.id = entry_id
+
+    @property
+    def word(self) -> str:
+        return self._store.word(self.id)
+
+    @property
+    def length(self) -> int:
+        return len(self.word)
+
+    @property
+    def definitions(self) -> List[str]:
+        return self._store.definitions(self.id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the entry in API response form."""
+        word = self.word
+        return {'word': word, 'length': len(word), 'definitions': self.definitions}
+
+    def __repr__(self) -> str:
+        return f"WordEntry({self.id}, {self.word!r})"
+
+
+class CompactWordStore:
+    """Read-only word entries packed into a few flat buffers.
+
+    Entries are sorted by (length, word), so each word length is a contiguous
+    id range. Storage is:
+
+    - words: all words concatenated into one bytes buffer, with entry i spanning
+      word_offsets[i]:word_offsets[i + 1]
+    - definitions: each distinct definition stored once in a second buffer,
+      addressed the same way through def_offsets
+    - entry_def_ids: definition ids for every entry, with entry i's ids at
+      entry_def_offsets[i]:entry_def_offsets[i + 1]
+
+    Extra named uint32 arrays (e.g. id sets built offline) can be attached via
+    `arrays` and are saved alongside the entries.
+
+    Example:
+        >>> store = CompactWordStore.build([
+        ...     {'word': 'HOUSE', 'length': 5, 'definitions': ['a dwelling']},
+        ...     {'word': 'CAT', 'length': 3, 'definitions': ['feline mammal']},
+        ... ])
+        >>> store.length_range(5)
+        (1, 2)
+        >>> store[1].to_dict()
+        {'word': 'HOUSE', 'length': 5, 'definitions': ['a dwelling']}
+    """
+
+    def __init__(self, words: bytes, word_offsets: array, definitions: bytes, def_offsets: array,
+                 entry_def_ids: array, entry_def_offsets: array,
+                 arrays: Optional[Dict[str, array]] = None, metadata: Optional[Dict[str, Any]] = None,
+                 length_ranges: Optional[Dict[int, Tuple[int, int]]] = None):
+        self._words = words
+        self._word_offsets = word_offsets
+        self._definitions = definitions
+        self._def_offsets = def_offsets
+        self._entry_def_ids = entry_def_ids
+        self._entry_def_offsets = entry_def_offsets
+        self.arrays = arrays or {}
+        self.metadata = metadata or {}
+        self._length_ranges = length_ranges if length_ranges is not None else self._compute_length_ranges()
+
+    @classmethod
+    def build(cls, entries: Iterable[Dict[str, Any]]) -> 'CompactWordStore':
+        """Pack word entries ({'word', 'length', 'definitions'}) into a store.
+
+        Duplicate words keep their first occurrence.
+        """
+        by_word: Dict[str, List[str]] = {}
+        for entry in entries:
+            by_word.setdefault(entry['word'].upper(), entry['definitions'])
+
+        words = bytearray()
+        word_offsets = _uint32_array([0])
+        definitions = bytearray()
+        def_offsets = _uint32_array([0])
+        def_ids: Dict[str, int] = {}
+        entry_def_ids = _uint32_array()
+        entry_def_offsets = _uint32_array([0])
+
+        for word in sorted(by_word, key=lambda w: (len(w), w)):
+            words += word.encode('utf-8')
+            word_offsets.append(len(words))
+            for definition in by_word[word]:
+                def_id = def_ids.get(definition)
+                if def_id is None:
+                    def_id = def_ids[definition] = len(def_ids)
+                    definitions += definition.encode('utf-8')
+                    def_offsets.append(len(definitions))
+                entry_def_ids.append(def_id)
+            entry_def_offsets.append(len(entry_def_ids))
+
+        return cls(bytes(words), word_offsets, bytes(definitions), def_offsets,
+                   entry_def_ids, entry_def_offsets)
+
+    def _compute_length_ranges(self) -> Dict[int, Tuple[int, int]]:
+        ranges: Dict[int, Tuple[int, int]] = {}
+        for entry_id in range(len(self)):
+            start, end = self._word_offsets[entry_id], self._word_offsets[entry_id + 1]
+            length = len(self._words[start:end].decode('utf-8'))
+            first, _ = ranges.get(length, (entry_id, entry_id))
+            ranges[length] = (first, entry_id + 1)
+        return ranges
+
+    def __len__(self) -> int:
+        return len(self._word_offsets) - 1
+
+    def __getitem__(self, entry_id: int) -> WordEntry:
+        if not 0 <= entry_id < len(self):
+            raise IndexError(entry_id)
+        return WordEntry(self, entry_id)
+
+    def word(self, entry_id: int) -> str:
+        """Get the (uppercase) word for an entry id."""
+        return self._words[self._word_offsets[entry_id]:self._word_offsets[entry_id + 1]].decode('utf-8')
+
+    def definitions(self, entry_id: int) -> List[str]:
+        """Get the definitions for an entry id."""
+        ids = self._entry_def_ids[self._entry_def_offsets[entry_id]:self._entry_def_offsets[entry_id + 1]]
+        return [self._definitions[self._def_offsets[i]:self._def_offsets[i + 1]].decode('utf-8') for i in ids]
+
+    def length_range(self, length: int) -> Tuple[int, int]:
+        """Get the [start, end) id range of entries with a given word length."""
+        return self._length_ranges.get(length, (0, 0))
+
+    def lengths(self) -> Dict[int, int]:
+        """Get the number of entries per word length."""
+        return {length: end - start for length, (start, end) in sorted(self._length_ranges.items())}
+
+    def nbytes(self) -> int:
+        """Approximate payload size in bytes (buffers and arrays, excluding views)."""
+        arrays = [self._word_offsets, self._def_offsets, self._entry_def_ids, self._entry_def_offsets,
+                  *self.arrays.values()]
+        return len(self._words) + len(self._definitions) + sum(a.itemsize * len(a) for a in arrays)
+
+    def _sections(self) -> List[Tuple[str, Any]]:
+        sections = [
+            ('words', self._words),
+            ('word_offsets', self._word_offsets),
+            ('definitions', self._definitions),
+            ('def_offsets', self._def_offsets),
+            ('entry_def_ids', self._entry_def_ids),
+            ('entry_def_offsets', self._entry_def_offsets),
+        ]
+        sections += [(f'array:{name}', values) for name, values in sorted(self.arrays.items())]
+        return sections
+
+    def save(self, path: str) -> None:
+        """Write the store to a binary file."""
+        sections = self._sections()
+        header = {
+            'version': FORMAT_VERSION,
+            'metadata': self.metadata,
+            # Saved so loading doesn't have to decode every word to find the ranges
+            'length_ranges': {str(length): list(bounds) for length, bounds in self._length_ranges.items()},
+            'sections': [
+                {'name': name, 'kind': 'bytes' if isinstance(data, bytes) else 'uint32', 'size': len(data)}
+                for name, data in sections
+            ],
+        }
+        header_bytes = json.dumps(header).encode('utf-8')
+
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header_bytes).to_bytes(4, 'little'))
+            f.write(header_bytes)
+            for _, data in sections:
+                if isinstance(data, array):
+                    if sys.byteorder == 'big':
+                        data = array(data.typecode, data)
+                        data.byteswap()
+                    data = data.tobytes()
+                f.write(data)
+
+    @classmethod
+    def load(cls, path: str) -> 'CompactWordStore':
+        """Read a store written by save().
+
+        Raises:
+            ValueError: If the file is not a word store or has an unknown version
+        """
+        with open(path, 'rb') as f:
+            raw = f.read()
+
+        if raw[:4] != MAGIC:
+            raise ValueError(f'{path} is not a word store')
+        header_length = int.from_bytes(raw[4:8], 'little')
+        header = json.loads(raw[8:8 + header_length])
+        if header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported word store version: {header.get('version')}")
+
+        sections: Dict[str, Any] = {}
+        position = 8 + header_length
+        for section in header['sections']:
+            if section['kind'] == 'bytes':
+                sections[section['name']] = raw[position:position + section['size']]
+                position += section['size']
+            else:
+                values = _uint32_array()
+                values.frombytes(raw[position:position + section['size'] * values.itemsize])
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                sections[section['name']] = values
+                position += section['size'] * values.itemsize
+
+        arrays = {name.split(':', 1)[1]: values for name, values in sections.items() if name.startswith('array:')}
+        return cls(sections['words'], sections['word_offsets'], sections['definitions'],
+                   sections['def_offsets'], sections['entry_def_ids'], sections['entry_def_offsets'],
+                   arrays=arrays, metadata=header.get('metadata'),
+                   length_ranges={int(length): tuple(bounds) for length, bounds in header['length_ranges'].items()})
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Local load-testing harness for the Hangman Word Generator API
+Fires synthetic API Gateway events at lambda_handler in-process or at local_server.py over HTTP
+
+Runs fully offline so serving modes can be compared on a single Linux box.
+
+Examples:
+    # In-process handler, 8 threads, 500 requests with a mix of lengths
+    uv run python load_test.py --target handler --mode thread -c 8 -n 500 --lengths 5:3,8:1
+
+    # Local HTTP server (start local_server.py first), asyncio client for 30 seconds
+    uv run python load_test.py --target http --mode asyncio -c 32 --duration 30 \\
+        --server-pid $(pgrep -f local_server.py)
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add lambda directory to path
+lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda')
+sys.path.insert(0, lambda_dir)
+
+# Latency histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+# (latency_seconds, status) where status is an HTTP code or 'error' for transport failures
+Sample = Tuple[float, Any]
+
+_handler = None
+
+
+class LoadTestContext:
+    """Minimal stand-in for the AWS Lambda context object."""
+
+    function_name = 'hangman-load-test'
+    aws_request_id = 'load-test'
+
+    def __init__(self, timeout_ms: int = 30000):
+        self._deadline = time.monotonic() + timeout_ms / 1000
+
+    def get_remaining_time_in_millis(self) -> int:
+        return max(0, int((self._deadline - time.monotonic()) * 1000))
+
+
+def parse_mix(spec: str) -> List[Tuple[int, int]]:
+    """Parse a weighted mix such as '5:3,8:1' into [(value, weight), ...].
+
+    A bare value ('5') has weight 1.
+    """
+    mix = []
+    for part in spec.split(','):
+        value, _, weight = part.strip().partition(':')
+        mix.append((int(value), int(weight or 1)))
+    if not mix or any(w <= 0 for _, w in mix):
+        raise argparse.ArgumentTypeError(f"invalid mix: {spec!r}")
+    return mix
+
+
+def choose(mix: List[Tuple[int, int]], rng: random.Random) -> int:
+    """Pick a value from a weighted mix."""
+    values, weights = zip(*mix)
+    return rng.choices(values, weights=weights)[0]
+
+
+def build_query(lengths, batch_sizes, rng: random.Random) -> Dict[str, str]:
+    """Build query parameters for one synthetic request."""
+    params = {'length': str(choose(lengths, rng))}
+    batch = choose(batch_sizes, rng)
+    if batch > 1:
+        params['count'] = str(batch)
+    return params
+
+
+def build_event(params: Dict[str, str]) -> Dict[str, Any]:
+    """Build an API Gateway HTTP API (payload v2.0) event for GET /word."""
+    return {
+        'version': '2.0',
+        'routeKey': 'GET /word',
+        'rawPath': '/word',
+        'rawQueryString': urllib.parse.urlencode(params),
+        'queryStringParameters': params,
+        'requestContext': {
+            'http': {'method': 'GET', 'path': '/word', 'sourceIp': '127.0.0.1'},
+            'requestId': 'load-test',
+        },
+        'isBase64Encoded': False,
+    }
+
+
+def _get_handler():
+    """Import lambda_handler lazily so HTTP runs never load WordNet."""
+    global _handler
+    if _handler is None:
+        from handler import lambda_handler
+        _handler = lambda_handler
+    return _handler
+
+
+def call_handler(params: Dict[str, str]) -> Sample:
+    """Invoke lambda_handler in-process and time it."""
+    handler = _get_handler()
+    start = time.perf_counter()
+    try:
+        status = handler(build_event(params), LoadTestContext())['statusCode']
+    except Exception:
+        status = 'error'
+    return time.perf_counter() - start, status
+
+
+def call_http(url: str, params: Dict[str, str], timeout: float) -> Sample:
+    """Issue a blocking GET against the local HTTP server and time it."""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(f"{url}/word?{urllib.parse.urlencode(params)}", timeout=timeout) as resp:
+            resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        status = e.code
+    except (urllib.error.URLError, OSError):
+        status = 'error'
+    return time.perf_counter() - start, status
+
+
+async def call_http_async(url: str, params: Dict[str, str], timeout: float) -> Sample:
+    """Issue a GET over a raw asyncio connection (stdlib only) and time it."""
+    parsed = urllib.parse.urlsplit(url)
+    host, port = parsed.hostname, parsed.port or 80
+    request = (
+        f"GET {parsed.path.rstrip('/')}/word?{urllib.parse.urlencode(params)} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\nConnection: close\r\n\r\n"
+    ).encode('ascii')
+
+    start = time.perf_counter()
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        writer.write(request)
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        await asyncio.wait_for(reader.read(), timeout)
+        writer.close()
+        status = int(status_line.split()[1])
+    except (OSError, asyncio.TimeoutError, IndexError, ValueError):
+        status = 'error'
+    return time.perf_counter() - start, status
+
+
+def run_worker(args: argparse.Namespace, quota: Optional[int], deadline: Optional[float],
+               seed: int) -> List[Sample]:
+    """Run requests sequentially until the quota or deadline is reached."""
+    rng = random.Random(seed)
+    samples = []
+    while (quota is None or len(samples) < quota) and (deadline is None or time.time() < deadline):
+        params = build_query(args.lengths, args.batch_sizes, rng)
+        if args.target == 'handler':
+            samples.append(call_handler(params))
+        else:
+            samples.append(call_http(args.url, params, args.timeout))
+    return samples
+
+
+def _quotas(total: Optional[int], workers: int) -> List[Optional[int]]:
+    """Split a total request count across workers."""
+    if total is None:
+        return [None] * workers
+    return [total // workers + (1 if i < total % workers else 0) for i in range(workers)]
+
+
+def run_threads(args, deadline) -> List[Sample]:
+    """Run workers on a thread pool sharing one handler instance."""
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(run_worker, args, quota, deadline, args.seed + i)
+                   for i, quota in enumerate(_quotas(args.requests, args.concurrency))]
+        return [s for f in futures for s in f.result()]
+
+
+def warm_up(args: argparse.Namespace) -> None:
+    """Send untimed requests per length so WordNet and caches load before the clock starts."""
+    if args.target != 'handler':
+        return
+    for length, _ in args.lengths:
+        for _ in range(args.warmup):
+            call_handler({'length': str(length)})
+
+
+def _init_process_worker(args: argparse.Namespace, pids) -> None:
+    """Warm up a worker process's own handler instance, then report its PID."""
+    warm_up(args)
+    pids.put(os.getpid())
+
+
+def start_process_pool(args, sampler: 'ResourceSampler') -> ProcessPoolExecutor:
+    """Start one warmed-up process per worker and add them to the resource sampler.
+
+    Returns once every worker has finished warming up, so warm-up is not timed.
+    """
+    pids = multiprocessing.Queue()
+    pool = ProcessPoolExecutor(max_workers=args.concurrency,
+                               initializer=_init_process_worker, initargs=(args, pids))
+    # Workers are spawned on submit; one no-op per worker starts them all
+    for future in [pool.submit(int) for _ in range(args.concurrency)]:
+        future.result()
+    sampler.add_pids(pids.get() for _ in range(args.concurrency))
+    return pool
+
+
+def run_processes(args, deadline, pool: ProcessPoolExecutor) -> List[Sample]:
+    """Run workers in separate processes, each with its own handler instance."""
+    futures = [pool.submit(run_worker, args, quota, deadline, args.seed + i)
+               for i, quota in enumerate(_quotas(args.requests, args.concurrency))]
+    return [s for f in futures for s in f.result()]
+
+
+async def _run_asyncio(args, deadline) -> List[Sample]:
+    rng = random.Random(args.seed)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    samples: List[Sample] = []
+
+    async def one():
+        async with semaphore:
+            params = build_query(args.lengths, args.batch_sizes, rng)
+            if args.target == 'handler':
+                # The handler is synchronous; offload it so the loop keeps scheduling
+                samples.append(await asyncio.to_thread(call_handler, params))
+            else:
+                samples.append(await call_http_async(args.url, params, args.timeout))
+
+    if args.requests is not None:
+        await asyncio.gather(*(one() for _ in range(args.requests)))
+    else:
+        async def loop_until_deadline():
+            while time.time() < deadline:
+                await one()
+        await asyncio.gather(*(loop_until_deadline() for _ in range(args.concurrency)))
+    return samples
+
+
+def run_asyncio(args, deadline) -> List[Sample]:
+    """Run requests as asyncio tasks bounded by a semaphore."""
+    return asyncio.run(_run_asyncio(args, deadline))
+
+
+class ResourceSampler(threading.Thread):
+    """Background sampler of CPU and RSS for this process, workers and the server.
+
+    Reads /proc directly so no third-party dependency is needed (Linux only).
+    """
+
+    def __init__(self, interval: float, pids: List[int]):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.pids = set(pids)
+        self.samples: List[Dict[str, Any]] = []
+        self._stop_event = threading.Event()
+        self._ticks = os.sysconf('SC_CLK_TCK')
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+
+    def add_pids(self, pids) -> None:
+        self.pids.update(pids)
+
+    def _read(self, pid: int) -> Optional[Tuple[float, int]]:
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                # Fields after the parenthesised command name; utime/stime are 14th/15th overall
+                fields = f.read().rsplit(')', 1)[1].split()
+            with open(f'/proc/{pid}/statm') as f:
+                rss_pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+        return (int(fields[11]) + int(fields[12])) / self._ticks, rss_pages * self._page_size
+
+    def snapshot(self) -> Dict[str, Any]:
+        cpu_seconds = {}
+        rss_bytes = 0
+        for pid in list(self.pids):
+            reading = self._read(pid)
+            if reading:
+                cpu_seconds[pid] = reading[0]
+                rss_bytes += reading[1]
+        return {'time': time.time(), 'cpu_seconds': cpu_seconds, 'rss_mb': rss_bytes / 2**20}
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            self.samples.append(self.snapshot())
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+        self.samples.append(self.snapshot())
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: List[Sample], elapsed: float, resources: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate raw samples into RPS, latency, status and resource statistics."""
+    latencies_ms = sorted(latency * 1000 for latency, _ in samples)
+    statuses = Counter(str(status) for _, status in samples)
+    errors = sum(n for status, n in statuses.items() if not status.startswith('2'))
+
+    histogram = Counter()
+    for value in latencies_ms:
+        bucket = next((b for b in HISTOGRAM_BUCKETS_MS if value <= b), None)
+        histogram[f"<={bucket}ms" if bucket else f">{HISTOGRAM_BUCKETS_MS[-1]}ms"] += 1
+
+    timeline = []
+    if resources:
+        start = resources[0]
+        for prev, cur in zip(resources, resources[1:]):
+            wall = cur['time'] - prev['time']
+            # Only count processes alive at both ends so exiting workers don't skew the delta
+            cpu = sum(cur['cpu_seconds'][pid] - prev['cpu_seconds'][pid]
+                      for pid in cur['cpu_seconds'].keys() & prev['cpu_seconds'].keys())
+            timeline.append({
+                't': round(cur['time'] - start['time'], 2),
+                'cpu_pct': round(100 * cpu / wall, 1) if wall else 0.0,
+                'rss_mb': round(cur['rss_mb'], 1),
+            })
+
+    return {
+        'requests': len(samples),
+        'elapsed_seconds': round(elapsed, 3),
+        'rps': round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        'status_codes': dict(sorted(statuses.items())),
+        'latency_ms': {
+            'min': round(latencies_ms[0], 2) if latencies_ms else 0.0,
+            'mean': round(sum(latencies_ms) / len(latencies_ms), 2) if latencies_ms else 0.0,
+            'p50': round(percentile(latencies_ms, 50), 2),
+            'p90': round(percentile(latencies_ms, 90), 2),
+            'p99': round(percentile(latencies_ms, 99), 2),
+            'max': round(latencies_ms[-1], 2) if latencies_ms else 0.0,
+        },
+        'histogram': {label: histogram[label] for label in
+                      [f"<={b}ms" for b in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+                      if histogram[label]},
+        'resources': timeline,
+    }
+
+
+def print_report(args: argparse.Namespace, report: Dict[str, Any]) -> None:
+    """Print a human-readable summary of a load test run."""
+    print("=" * 60)
+    print(f"Load test: target={args.target} mode={args.mode} concurrency={args.concurrency}")
+    print("=" * 60)
+    print(f"Requests:    {report['requests']} in {report['elapsed_seconds']}s")
+    print(f"Throughput:  {report['rps']} req/s")
+    print(f"Error rate:  {report['error_rate'] * 100:.2f}%")
+    print(f"Status codes: {report['status_codes']}")
+
+    latency = report['latency_ms']
+    print(f"\nLatency (ms): min={latency['min']} mean={latency['mean']} p50={latency['p50']} "
+          f"p90={latency['p90']} p99={latency['p99']} max={latency['max']}")
+
+    print("\nLatency histogram:")
+    peak = max(report['histogram'].values(), default=1)
+    for label, count in report['histogram'].items():
+        print(f"  {label:>9} {count:>7} {'#' * max(1, round(40 * count / peak))}")
+
+    if report['resources']:
+        print("\nCPU / RSS over time:")
+        for point in report['resources']:
+            print(f"  t={point['t']:>7}s  cpu={point['cpu_pct']:>6}%  rss={point['rss_mb']:>8} MB")
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run a load test from command-line arguments and return the report."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--target', choices=['handler', 'http'], default='handler',
+                        help='Call lambda_handler in-process or local_server.py over HTTP')
+    parser.add_argument('--mode', choices=['thread', 'process', 'asyncio'], default='thread',
+                        help='Concurrency model for the load generator')
+    parser.add_argument('-c', '--concurrency', type=int, default=4, help='Concurrent workers')
+    parser.add_argument('-n', '--requests', type=int, default=None,
+                        help='Total requests to send (default: 200 unless --duration is set)')
+    parser.add_argument('--duration', type=float, default=None, help='Run for this many seconds instead')
+    parser.add_argument('--lengths', type=parse_mix, default=parse_mix('5'),
+                        help="Weighted word length mix, e.g. '5:3,8:1'")
+    parser.add_argument('--batch-sizes', type=parse_mix, default=parse_mix('1'),
+                        help="Weighted mix of words per request (sent as 'count'), e.g. '1:4,5:1'")
+    parser.add_argument('--url', default='http://localhost:8000', help='Base URL for --target http')
+    parser.add_argument('--timeout', type=float, default=30.0, help='HTTP request timeout in seconds')
+    parser.add_argument('--server-pid', type=int, nargs='+', action='extend', default=[],
+                        help='Also sample CPU/RSS of these PIDs (e.g. local_server.py and its reloader)')
+    parser.add_argument('--sample-interval', type=float, default=1.0, help='CPU/RSS sampling interval')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='Untimed warm-up requests per length (loads WordNet and caches)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the request mix')
+    parser.add_argument('--json', dest='json_path', help='Also write the report as JSON to this path')
+    args = parser.parse_args(argv)
+
+    if args.requests is None and args.duration is None:
+        args.requests = 200
+
+    sampler = ResourceSampler(args.sample_interval, [os.getpid()] + args.server_pid)
+    if args.mode == 'process':
+        # Each worker process has its own handler, so each warms up in its initializer
+        pool = start_process_pool(args, sampler)
+    else:
+        # Pay WordNet loading once before the clock starts
+        warm_up(args)
+    sampler.start()
+
+    deadline = time.time() + args.duration if args.duration is not None else None
+    start = time.perf_counter()
+    if args.mode == 'thread':
+        samples = run_threads(args, deadline)
+    elif args.mode == 'process':
+        with pool:
+            samples = run_processes(args, deadline, pool)
+    else:
+        samples = run_asyncio(args, deadline)
+    elapsed = time.perf_counter() - start
+    sampler.stop()
+
+    report = summarize(samples, elapsed, sampler.samples)
+    report['config'] = {
+        'target': args.target, 'mode': args.mode, 'concurrency': args.concurrency,
+        'lengths': args.lengths, 'batch_sizes': args.batch_sizes,
+    }
+    print_report(args, report)
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json_path}")
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
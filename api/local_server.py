@@ -2,9 +2,10 @@
 Local development server for Hangman Word Generator API
 Runs the Lambda handler as a Flask API with Swagger UI for interactive testing
 """
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, stream_with_context
 from flask_cors import CORS
 import yaml
+import atexit
 import sys
 import os
 import importlib.util
@@ -19,6 +20,24 @@ spec = importlib.util.spec_from_file_location("handler", handler_path)
 handler_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(handler_module)
 lambda_handler = handler_module.lambda_handler
+# Registered under the name 'handler' so vocabulary.py reuses the module loaded above
+sys.modules['handler'] = handler_module
+
+from vocabulary import export_vocabulary  # noqa: E402
+from word_pool import WordPool  # noqa: E402
+
+
+# Keep ready queues of validated words so /word requests pop instead of filtering
+# inline. The worker starts on the first request; WORD_POOL=false disables it.
+word_pool = None
+if os.environ.get('WORD_POOL', 'true').lower() != 'false':
+    word_pool = WordPool(
+        handler_module.refill_pool_word,
+        low_watermark=int(os.environ.get('WORD_POOL_LOW', '4')),
+        high_watermark=int(os.environ.get('WORD_POOL_HIGH', '16')),
+    )
+    handler_module.word_pool = word_pool
+    atexit.register(word_pool.stop)
 
 
 app = Flask(__name__)
@@ -119,8 +138,18 @@ def get_word():
             "attempts": 3
         }
     """
+    return _call_lambda_handler()
+
+
+def _call_lambda_handler():
+    """Run the current Flask request through the Lambda handler.
+
+    Returns:
+        Flask response with the handler's status code, headers and body
+    """
     # Convert Flask request to Lambda event format
     event = {
+        'rawPath': request.path,
         'queryStringParameters': dict(request.args) if request.args else None
     }
 
@@ -146,6 +175,104 @@ def get_word():
     return flask_response
 
 
+@app.route('/anagrams')
+def get_anagrams():
+    """Find every filtered word that uses exactly the given letters.
+
+    Served by the Lambda handler from an index keyed by sorted letters, so a
+    lookup is a single dict access. Requires the prebuilt word index.
+
+    Query Parameters:
+        letters (str): Letters to rearrange (3 to 16 of A-Z)
+        limit (int, optional): Maximum words returned (default: 100, max: 1000)
+
+    Returns:
+        JSON response with matching words (200), error message (400), or
+        503 if there is no word index
+
+    Example:
+        GET /anagrams?letters=stare
+
+        Response:
+        {
+            "letters": "STARE",
+            "words": ["ASTER", "RATES", "STARE", "TEARS"],
+            "count": 4,
+            "truncated": false,
+            "elapsed_ms": 0.012
+        }
+    """
+    return _call_lambda_handler()
+
+
+@app.route('/subwords')
+def get_subwords():
+    """Find every filtered word that can be spelled from the given letters.
+
+    Each letter may be used as often as it appears in the query. Results are
+    sorted longest first. Requires the prebuilt word index.
+
+    Query Parameters:
+        letters (str): Available letters (3 to 16 of A-Z)
+        min_length (int, optional): Shortest word to return (default: 3)
+        limit (int, optional): Maximum words returned (default: 100, max: 1000)
+
+    Returns:
+        JSON response with matching words (200), error message (400), or
+        503 if there is no word index
+
+    Example:
+        GET /subwords?letters=cats
+
+        Response:
+        {
+            "letters": "CATS",
+            "words": ["CATS", "SCAT", "ACT", "CAT", "SAC"],
+            "count": 5,
+            "truncated": false,
+            "elapsed_ms": 0.031
+        }
+    """
+    return _call_lambda_handler()
+
+
+@app.route('/export')
+def export():
+    """Stream the full filtered vocabulary as NDJSON.
+
+    Every word that passes the content filters is streamed as one JSON object
+    per line, with definitions. The response is generated lazily, so memory use
+    stays constant regardless of corpus size.
+
+    Query Parameters:
+        min_length (int, optional): Minimum word length (minimum: 3, default: 3)
+        max_length (int, optional): Maximum word length (default: no limit)
+        gzip (bool, optional): Gzip the stream (sent with Content-Encoding: gzip)
+
+    Returns:
+        Streaming application/x-ndjson response (200) or error message (400)
+
+    Example:
+        GET /export?min_length=5&max_length=6
+
+        Response:
+        {"word": "HOUSE", "length": 5, "definitions": ["a dwelling that serves as living quarters ..."]}
+        {"word": "TIGER", "length": 5, "definitions": ["large feline of forests in most of Asia ..."]}
+    """
+    try:
+        min_length = int(request.args.get('min_length', 3))
+        max_length = int(request.args['max_length']) if request.args.get('max_length') else None
+        compress = request.args.get('gzip', '').lower() in ('1', 'true')
+        chunks = export_vocabulary(min_length, max_length, compress=compress)
+    except ValueError as e:
+        return jsonify({'error': f'Invalid parameter: {str(e)}'}), 400
+
+    response = app.response_class(stream_with_context(chunks), mimetype='application/x-ndjson')
+    if compress:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
 @app.route('/health')
 def health():
     """Health check endpoint for monitoring and load balancers.
@@ -167,6 +294,39 @@ def health():
     return jsonify({'status': 'healthy', 'service': 'hangman-word-generator'})
 
 
+@app.route('/stats')
+def stats():
+    """Runtime statistics for this server process.
+
+    Reports rolling get_random_word latency percentiles, filter statistics,
+    words per length, cache hit rates and evictions, init-phase timings, RSS,
+    and word pool queue depths and refill lag. Everything is recorded as
+    requests run, so this is cheap to poll.
+    The deployed Lambda returns the same data for a direct invocation with
+    {"action": "stats"}.
+
+    Returns:
+        JSON object from handler.get_runtime_stats()
+
+    Example:
+        GET /stats
+
+        Response:
+        {
+            "latency": {"get_random_word": {"calls": 30, "window": 30, "p50_ms": 2.8, ...}},
+            "filter_stats": {"attempts": 31, "no_definition": 1},
+            "bucket_sizes": {"wordnet": {"5": 346}},
+            "caches": {"words_of_length": {"hits": 27, "misses": 3, "hit_rate": 0.9, ...}, ...},
+            "init_ms": {"wordnet_load": 812.4},
+            "memory": {"rss_mb": 55.3, "max_rss_mb": 55.3},
+            "word_pool": {"running": true, "lengths": {"5": {"depth": 14, "hits": 9, "last_refill_lag_ms": 31.2, ...}}}
+        }
+    """
+    stats = handler_module.get_runtime_stats()
+    stats['word_pool'] = word_pool.stats() if word_pool is not None else None
+    return jsonify(stats)
+
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("Hangman Word Generator API - Local Development Server")
@@ -176,8 +336,13 @@ if __name__ == '__main__':
     print("\nAPI Endpoints:")
     print("   GET http://localhost:8000/word")
     print("   GET http://localhost:8000/word?length=8")
-    print("\nHealth Check:")
+    print("   GET http://localhost:8000/anagrams?letters=stare")
+    print("   GET http://localhost:8000/subwords?letters=cats")
+    print("\nVocabulary Export (NDJSON):")
+    print("   GET http://localhost:8000/export?min_length=5&max_length=8")
+    print("\nHealth Check and Runtime Stats:")
     print("   GET http://localhost:8000/health")
+    print("   GET http://localhost:8000/stats")
     print("\n" + "="*60 + "\n")
 
     app.run(host='0.0.0.0', port=8000, debug=True)
@@ -4,6 +4,18 @@ Pytest configuration for hangman word generator tests
 import sys
 import os
 
+import pytest
+
 # Add lambda directory to path so tests can import handler
 lambda_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lambda')
 sys.path.insert(0, lambda_dir)
+
+from word_store import CompactWordStore  # noqa: E402
+
+
+@pytest.fixture
+def make_store():
+    """Factory building a word store from bare words (no definitions)"""
+    def build(*words):
+        return CompactWordStore.build([{'word': w, 'length': len(w), 'definitions': []} for w in words])
+    return build
@@ -0,0 +1,61 @@
+"""
+Pytest tests for the anagram and letter-multiset index
+"""
+import pytest
+
+from anagrams import AnagramIndex, letter_mask, normalize_letters
+
+WORDS = ['STARE', 'TEARS', 'RATES', 'ASTER', 'TEA', 'EAT', 'SEAT', 'STREET', 'TREES', 'CAT', "O'CLOCK"]
+
+
+@pytest.fixture
+def index(make_store):
+    """Anagram index over a small word store"""
+    return AnagramIndex.build(make_store(*WORDS))
+
+
+class TestAnagramIndex:
+    """Tests for AnagramIndex lookups"""
+
+    def test_anagrams(self, index):
+        """Test that all words with the same letters are found"""
+        assert index.anagrams('stare') == ['ASTER', 'RATES', 'STARE', 'TEARS']
+        assert index.anagrams('ate') == ['EAT', 'TEA']
+        assert index.anagrams('xyz') == []
+
+    def test_subwords(self, index):
+        """Test words spellable from a rack, longest first"""
+        assert index.subwords('tears') == ['ASTER', 'RATES', 'STARE', 'TEARS', 'SEAT', 'EAT', 'TEA']
+
+    def test_subwords_respect_letter_counts(self, index):
+        """Test that repeated letters must be available repeatedly"""
+        assert 'STREET' not in index.subwords('strate')
+        assert 'TREES' not in index.subwords('trest')
+        assert 'TREES' in index.subwords('treset')
+
+    def test_subwords_min_length(self, index):
+        """Test filtering short words"""
+        assert index.subwords('tears', min_length=5) == ['ASTER', 'RATES', 'STARE', 'TEARS']
+
+    def test_subwords_many_distinct_letters(self, index):
+        """Test queries with more distinct letters than indexed letter sets"""
+        assert index.subwords('abcdefghijkmnopt') == ['CAT', 'EAT', 'TEA']
+
+    def test_non_letter_words_not_indexed(self, index):
+        """Test that words with punctuation are skipped"""
+        assert len(index) == len(WORDS) - 1
+        assert index.signature_count() == 6
+
+    def test_invalid_letters(self, index):
+        """Test validation of the letters query"""
+        with pytest.raises(ValueError, match='A-Z'):
+            index.anagrams('ab1')
+        with pytest.raises(ValueError, match='3 to 16'):
+            index.subwords('ab')
+        with pytest.raises(ValueError, match='3 to 16'):
+            normalize_letters('a' * 17)
+
+    def test_letter_mask(self):
+        """Test the distinct-letter bitmask"""
+        assert letter_mask('ABA') == 0b11
+        assert letter_mask('Z') == 1 << 25
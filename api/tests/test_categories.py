@@ -0,0 +1,47 @@
+"""
+Pytest tests for themed word categories
+"""
+from categories import (attach_categories, available_categories, build_category_ids,
+                        category_id_range, ARRAY_PREFIX)
+from array import array
+
+
+class TestCategoryIndex:
+    """Tests for precomputed category membership"""
+
+    def test_words_classified_by_hypernym(self, make_store):
+        """Test that words land in the category of their hypernym root"""
+        store = make_store('TIGER', 'APPLE', 'HOUSE')
+        ids = build_category_ids(store)
+        members = {category: {store.word(i) for i in values} for category, values in ids.items()}
+
+        assert 'TIGER' in members['animals']
+        assert 'APPLE' in members['food']
+        assert 'HOUSE' not in members['animals']
+        assert 'TIGER' not in members['food']
+
+    def test_category_ids_sorted(self, make_store):
+        """Test that category id arrays are sorted for binary search"""
+        store = make_store('TIGER', 'HORSE', 'CAT', 'ELEPHANT', 'DOG')
+        ids = build_category_ids(store)['animals']
+        assert list(ids) == sorted(ids)
+
+    def test_attach_categories(self, make_store):
+        """Test that categories are attached to the store and listed"""
+        store = make_store('TIGER', 'APPLE')
+        counts = attach_categories(store)
+
+        assert counts['animals'] >= 1
+        assert available_categories(store) == ('animals', 'food', 'places')
+        assert available_categories(None) == ()
+
+    def test_category_id_range(self, make_store):
+        """Test intersecting a category with a length range"""
+        store = make_store('CAT')
+        store.arrays[ARRAY_PREFIX + 'animals'] = array('I', [1, 4, 5, 9, 12])
+
+        ids, lo, hi = category_id_range(store, 'animals', 4, 10)
+        assert list(ids[lo:hi]) == [4, 5, 9]
+
+        ids, lo, hi = category_id_range(store, 'animals', 6, 9)
+        assert lo == hi
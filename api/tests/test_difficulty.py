@@ -0,0 +1,65 @@
+"""
+Pytest tests for difficulty-tiered word sampling
+"""
+from difficulty import (attach_difficulty, available_difficulties, compute_scores,
+                        difficulty_id_range, DIFFICULTY_TIERS)
+from word_store import CompactWordStore
+
+
+class TestDifficultyScores:
+    """Tests for vectorized difficulty scoring"""
+
+    def test_common_letters_easier(self):
+        """Test that words of common letters score easier than rare ones"""
+        scores = compute_scores(['TEASE', 'JAZZY'], [0, 0])
+        assert scores[0] < scores[1]
+
+    def test_frequent_lemmas_easier(self):
+        """Test that frequent lemmas score easier at equal spelling difficulty"""
+        scores = compute_scores(['HOUSE', 'HOUSE', 'MOUSE'], [50, 0, 0])
+        assert scores[0] < scores[1]
+
+    def test_non_letters_ignored(self):
+        """Test that punctuation does not break scoring"""
+        scores = compute_scores(["O'CLOCK", 'CLOCKS'], [1, 1])
+        assert len(scores) == 2
+
+
+class TestDifficultyTiers:
+    """Tests for per-length difficulty tiers"""
+
+    def test_every_word_in_one_tier(self, make_store):
+        """Test that tiers partition each word length"""
+        store = make_store('CAT', 'DOG', 'FOX', 'HOUSE', 'JAZZY', 'TEASE', 'QUAKE', 'PIZZA', 'STEER')
+        counts = attach_difficulty(store, counts=[0] * len(store))
+
+        assert sum(counts.values()) == len(store)
+        assert available_difficulties(store) == DIFFICULTY_TIERS
+
+        for length, total in store.lengths().items():
+            sizes = [hi - lo for _, lo, hi in (difficulty_id_range(store, tier, length)
+                                               for tier in DIFFICULTY_TIERS)]
+            assert sum(sizes) == total
+            assert max(sizes) - min(sizes) <= 1
+
+    def test_tier_ranges_match_length(self, make_store):
+        """Test that a tier slice only holds words of the requested length"""
+        store = make_store('CAT', 'DOG', 'FOX', 'HOUSE', 'JAZZY', 'TEASE')
+        attach_difficulty(store, counts=[0] * len(store))
+
+        ids, lo, hi = difficulty_id_range(store, 'hard', 5)
+        assert [store.word(i) for i in ids[lo:hi]] == ['JAZZY']
+
+        ids, lo, hi = difficulty_id_range(store, 'easy', 7)
+        assert lo == hi
+
+    def test_tiers_saved_with_store(self, make_store, tmp_path):
+        """Test that tiers survive a save/load round trip"""
+        store = make_store('HOUSE', 'JAZZY', 'TEASE')
+        attach_difficulty(store, counts=[0, 0, 0])
+        path = tmp_path / 'index.bin'
+        store.save(str(path))
+        loaded = CompactWordStore.load(str(path))
+
+        assert difficulty_id_range(loaded, 'easy', 5)[1:] == difficulty_id_range(store, 'easy', 5)[1:]
+        assert available_difficulties(make_store()) == ()
@@ -1,11 +1,20 @@
 """
 Pytest tests for the hangman word generator Lambda function
 """
-from handler import lambda_handler, get_random_word, is_word_valid
+from handler import (lambda_handler, get_random_word, is_word_valid, get_time_budget_ms,
+                     refill_pool_word, WordGenerationTimeout, DEADLINE_SAFETY_MARGIN_MS)
+from seen_words import SeenWordsFilter
+from word_store import CompactWordStore
+from difficulty import attach_difficulty, difficulty_id_range, DIFFICULTY_TIERS
+import handler
+import runtime_stats
 import sys
 import os
 import json
+import re
+import time
 import pytest
+from array import array
 
 # Add lambda directory to path
 lambda_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lambda')
@@ -157,3 +166,368 @@ class TestLambdaHandler:
         assert response['statusCode'] == 400
         body = json.loads(response['body'])
         assert 'error' in body
+
+    def test_handler_returns_seen_token(self):
+        """Test that the handler returns a token covering the served word"""
+        event = {'queryStringParameters': {'length': '5'}}
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert body['word'] in SeenWordsFilter.from_token(body['seen'])
+
+    def test_handler_excludes_seen_words(self):
+        """Test that words in the seen token are not served again"""
+        token = None
+        words = []
+        for _ in range(10):
+            params = {'length': '4'}
+            if token:
+                params['seen'] = token
+            response = lambda_handler({'queryStringParameters': params}, None)
+            body = json.loads(response['body'])
+            words.append(body['word'])
+            token = body['seen']
+
+        assert len(set(words)) == len(words)
+
+    def test_handler_recovers_from_exhausted_token(self, monkeypatch):
+        """Test that a token excluding every word of a length is replaced, not a 500"""
+        monkeypatch.setattr(handler, 'get_word_store', lambda: None)
+        monkeypatch.setattr(handler, 'get_words_of_length', lambda length: ('house', 'tiger', 'apple'))
+        monkeypatch.setattr(handler, 'is_word_valid', lambda word, length: (True, None))
+        monkeypatch.setattr(handler, 'get_word_definitions', lambda word: ['a definition'])
+
+        token = None
+        words = []
+        for _ in range(5):
+            params = {'length': '5', **({'seen': token} if token else {})}
+            response = lambda_handler({'queryStringParameters': params}, None)
+            assert response['statusCode'] == 200
+            body = json.loads(response['body'])
+            words.append(body['word'])
+            token = body['seen']
+
+        # The first three exhaust the length; the next word starts a fresh token
+        assert sorted(words[:3]) == ['APPLE', 'HOUSE', 'TIGER']
+        assert SeenWordsFilter.from_token(token).count == 2
+
+    def test_handler_rotates_saturated_token(self):
+        """Test that a saturated token is cleared before use"""
+        seen = SeenWordsFilter()
+        for i in range(1000):
+            seen.add(f"served{i}")
+        event = {'queryStringParameters': {'length': '5', 'seen': seen.to_token()}}
+        body = json.loads(lambda_handler(event, None)['body'])
+
+        assert SeenWordsFilter.from_token(body['seen']).count == 1
+
+    def test_handler_invalid_seen_token(self):
+        """Test handler with a corrupt seen token"""
+        event = {
+            'queryStringParameters': {
+                'seen': 'not-a-token'
+            }
+        }
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 400
+        body = json.loads(response['body'])
+        assert 'error' in body
+
+    def test_handler_batch(self):
+        """Test handler returning a batch of distinct words"""
+        event = {
+            'queryStringParameters': {
+                'length': '6',
+                'count': '5'
+            }
+        }
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert len(body['words']) == 5
+        assert len({w['word'] for w in body['words']}) == 5
+        assert all(w['length'] == 6 for w in body['words'])
+
+        seen = SeenWordsFilter.from_token(body['seen'])
+        assert all(w['word'] in seen for w in body['words'])
+
+    @pytest.mark.parametrize("count", ['0', '11'])
+    def test_handler_invalid_batch_size(self, count):
+        """Test handler with an out-of-range batch size"""
+        event = {
+            'queryStringParameters': {
+                'count': count
+            }
+        }
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 400
+        body = json.loads(response['body'])
+        assert 'error' in body
+
+    def test_refill_timed_apart_from_requests(self, monkeypatch):
+        """Test that pool refills are not recorded as request latency"""
+        monkeypatch.setattr(handler, 'word_pool', None)
+        runtime_stats.reset()
+        word = refill_pool_word(5)
+        stats = lambda_handler({'action': 'stats'}, None)
+
+        assert word['length'] == 5
+        assert stats['latency']['word_pool_refill']['calls'] == 1
+        assert 'get_random_word' not in stats['latency']
+
+    def test_handler_unknown_category(self):
+        """Test handler with an unknown category"""
+        event = {'queryStringParameters': {'category': 'vehicles'}}
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 400
+
+    def test_category_requires_index(self, monkeypatch):
+        """Test that categories fail cleanly without a word index"""
+        monkeypatch.setattr(handler, 'get_word_store', lambda: None)
+        event = {'queryStringParameters': {'category': 'animals'}}
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 503
+
+    def test_handler_unknown_difficulty(self):
+        """Test handler with an unknown difficulty"""
+        event = {'queryStringParameters': {'difficulty': 'impossible'}}
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 400
+        assert 'easy, medium, hard' in json.loads(response['body'])['error']
+
+    def test_handler_stats_action(self):
+        """Test that a direct stats invocation returns runtime statistics"""
+        lambda_handler({'queryStringParameters': {'length': '5'}}, None)
+        stats = lambda_handler({'action': 'stats'}, None)
+
+        assert stats['latency']['get_random_word']['calls'] >= 1
+        assert stats['filter_stats']['attempts'] >= 1
+        assert 'words_of_length' in stats['caches']
+        assert 'wordnet_load' in stats['init_ms']
+
+    def test_handler_stats_not_exposed_to_api(self):
+        """Test that API Gateway requests cannot trigger the stats action"""
+        event = {'action': 'stats', 'requestContext': {}, 'queryStringParameters': None}
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 200
+        assert 'word' in json.loads(response['body'])
+
+    def test_handler_uses_word_pool(self, monkeypatch):
+        """Test that an installed word pool serves plain length requests"""
+        class ReadyPool:
+            def take(self, length, seen=None):
+                return {'word': 'POOLED', 'length': length, 'definitions': ['ready'], 'attempts': 1}
+
+        monkeypatch.setattr(handler, 'word_pool', ReadyPool())
+        body = json.loads(lambda_handler({'queryStringParameters': {'length': '6'}}, None)['body'])
+
+        assert body['word'] == 'POOLED'
+        assert get_random_word(length=6, use_pool=False)['word'] != 'POOLED'
+
+    def test_handler_skips_pool_for_lengths_without_words(self, monkeypatch):
+        """Test that lengths with no words never reach the word pool"""
+        class RecordingPool:
+            lengths = []
+
+            def take(self, length, seen=None):
+                self.lengths.append(length)
+                return None
+
+        monkeypatch.setattr(handler, 'word_pool', RecordingPool())
+        response = lambda_handler({'queryStringParameters': {'length': '40'}}, None)
+
+        assert 'No words of length 40' in json.loads(response['body'])['message']
+        assert RecordingPool.lengths == []
+
+    def test_letters_routes_require_index(self, monkeypatch):
+        """Test that the letters routes fail cleanly without a word index"""
+        monkeypatch.setattr(handler, 'get_word_store', lambda: None)
+        handler.get_anagram_index.cache_clear()
+        response = lambda_handler({'rawPath': '/anagrams', 'queryStringParameters': {'letters': 'cat'}}, None)
+        handler.get_anagram_index.cache_clear()
+
+        assert response['statusCode'] == 503
+
+
+class MockContext:
+    """Minimal Lambda context with a fixed remaining time"""
+
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+class TestTimeBudget:
+    """Tests for deadline-aware word generation"""
+
+    def test_budget_from_lambda_context(self):
+        """Test that the budget leaves a safety margin before the Lambda timeout"""
+        assert get_time_budget_ms(MockContext(30000)) == 30000 - DEADLINE_SAFETY_MARGIN_MS
+        assert get_time_budget_ms(MockContext(100)) == 0
+
+    def test_budget_without_context(self):
+        """Test that a budget is applied when running locally"""
+        assert get_time_budget_ms(None) > 0
+
+    def test_expired_deadline_raises_timeout(self):
+        """Test that generation stops when the deadline has passed"""
+        with pytest.raises(WordGenerationTimeout):
+            get_random_word(length=5, max_attempts=None, deadline=time.monotonic())
+
+    def test_handler_reports_budget(self):
+        """Test that successful responses include the budget spent"""
+        response = lambda_handler({'queryStringParameters': None}, MockContext(30000))
+
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert body['budget_ms'] == 30000 - DEADLINE_SAFETY_MARGIN_MS
+        assert 0 <= body['elapsed_ms'] <= body['budget_ms']
+
+    def test_handler_timeout_returns_503(self):
+        """Test that an exhausted budget returns a fast 503"""
+        response = lambda_handler({'queryStringParameters': None}, MockContext(DEADLINE_SAFETY_MARGIN_MS))
+
+        assert response['statusCode'] == 503
+        assert 'Retry-After' in response['headers']
+        body = json.loads(response['body'])
+        assert body['error'] == 'Word generation timed out'
+        assert body['budget_ms'] == 0
+
+
+class TestWordIndex:
+    """Tests for sampling from the prebuilt word index"""
+
+    @pytest.fixture
+    def indexed_store(self, monkeypatch):
+        """Serve words from a small in-memory word index"""
+        store = CompactWordStore.build([
+            {'word': 'HOUSE', 'length': 5, 'definitions': ['a dwelling']},
+            {'word': 'TIGER', 'length': 5, 'definitions': ['large feline']},
+            {'word': 'CAT', 'length': 3, 'definitions': ['feline mammal']},
+        ])
+        monkeypatch.setattr(handler, 'get_word_store', lambda: store)
+        return store
+
+    def test_samples_from_index(self, indexed_store):
+        """Test that words come from the index when one is loaded"""
+        result = get_random_word(length=5)
+
+        assert result['word'] in ('HOUSE', 'TIGER')
+        assert result['length'] == 5
+        assert result['definitions']
+
+    def test_index_respects_seen(self, indexed_store):
+        """Test that seen words are excluded when sampling from the index"""
+        seen = SeenWordsFilter()
+        seen.add('HOUSE')
+
+        for _ in range(10):
+            assert get_random_word(length=5, seen=seen)['word'] == 'TIGER'
+
+    def test_index_exhausted(self, indexed_store):
+        """Test that an exhausted length fails fast instead of spinning"""
+        seen = SeenWordsFilter()
+        seen.add('CAT')
+
+        with pytest.raises(Exception, match='No unseen words'):
+            get_random_word(length=3, max_attempts=None, seen=seen)
+
+    def test_handler_exhausted_index_length(self, indexed_store):
+        """Test that a batch beyond the words of a length restarts the token"""
+        seen = SeenWordsFilter()
+        seen.add('HOUSE')
+        seen.add('TIGER')
+        event = {'queryStringParameters': {'length': '5', 'count': '3', 'seen': seen.to_token()}}
+        response = lambda_handler(event, None)
+
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert sorted(w['word'] for w in body['words']) == ['HOUSE', 'TIGER']
+        assert body['partial'] is True
+
+    def test_index_category(self, indexed_store):
+        """Test that a category restricts sampling to its members"""
+        indexed_store.arrays['category:animals'] = array('I', [
+            i for i in range(len(indexed_store)) if indexed_store.word(i) in ('CAT', 'TIGER')])
+
+        for _ in range(10):
+            assert get_random_word(length=5, category='animals')['word'] == 'TIGER'
+
+    def test_index_difficulty(self, indexed_store):
+        """Test that a difficulty restricts sampling to its tier"""
+        attach_difficulty(indexed_store, counts=[0] * len(indexed_store))
+        tiers = {tier: difficulty_id_range(indexed_store, tier, 5) for tier in DIFFICULTY_TIERS}
+
+        for tier, (ids, lo, hi) in tiers.items():
+            if lo < hi:
+                words = {indexed_store.word(i) for i in ids[lo:hi]}
+                assert get_random_word(length=5, difficulty=tier)['word'] in words
+            else:
+                with pytest.raises(Exception, match='No words of length 5'):
+                    get_random_word(length=5, difficulty=tier)
+
+    def test_index_category_and_difficulty(self, indexed_store):
+        """Test combining a category with a difficulty tier"""
+        attach_difficulty(indexed_store, counts=[0] * len(indexed_store))
+        tiger = next(i for i in range(len(indexed_store)) if indexed_store.word(i) == 'TIGER')
+        indexed_store.arrays['category:animals'] = array('I', [tiger])
+        tier = other = None
+        for name in DIFFICULTY_TIERS:
+            ids, lo, hi = difficulty_id_range(indexed_store, name, 5)
+            if tiger in ids[lo:hi]:
+                tier = name
+            elif lo < hi:
+                other = name
+
+        assert get_random_word(length=5, category='animals', difficulty=tier)['word'] == 'TIGER'
+        message = re.escape(f"No words of length 5 in category 'animals' at difficulty '{other}'")
+        with pytest.raises(Exception, match=message):
+            get_random_word(length=5, category='animals', difficulty=other, seen=SeenWordsFilter())
+        with pytest.raises(Exception, match=message):
+            get_random_word(length=5, category='animals', difficulty=other, max_attempts=1)
+
+    def test_anagrams_route(self, indexed_store):
+        """Test the /anagrams route"""
+        handler.get_anagram_index.cache_clear()
+        event = {'rawPath': '/anagrams', 'queryStringParameters': {'letters': 'tac'}}
+        response = lambda_handler(event, None)
+        handler.get_anagram_index.cache_clear()
+
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert body['words'] == ['CAT']
+        assert body['count'] == 1
+
+    def test_subwords_route(self, indexed_store):
+        """Test the /subwords route with a stage prefix and a limit"""
+        handler.get_anagram_index.cache_clear()
+        event = {'rawPath': '/prod/subwords', 'queryStringParameters': {'letters': 'housecat', 'limit': '1'}}
+        response = lambda_handler(event, None)
+        handler.get_anagram_index.cache_clear()
+
+        body = json.loads(response['body'])
+        assert body['words'] == ['HOUSE']
+        assert body['count'] == 2
+        assert body['truncated'] is True
+
+    def test_letters_routes_validate(self, indexed_store):
+        """Test invalid letters and limits on the letters routes"""
+        for params in ({'letters': 'a1c'}, {'letters': 'abc', 'limit': '0'}, {},
+                       {'letters': 'abc', 'min_length': '0'}, {'letters': 'abc', 'min_length': '17'}):
+            response = lambda_handler({'rawPath': '/subwords', 'queryStringParameters': params}, None)
+            assert response['statusCode'] == 400
+
+    def test_index_missing_length(self, indexed_store):
+        """Test that a length absent from the index raises"""
+        with pytest.raises(Exception, match='No words of length 4'):
+            get_random_word(length=4)
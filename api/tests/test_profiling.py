@@ -0,0 +1,117 @@
+"""
+Pytest tests for the opt-in request profiling hooks
+"""
+import json
+import logging
+import profiling
+from profiling import profile_request, load_config
+import pytest
+
+
+def _busy_handler(event, context):
+    """Small handler doing measurable work"""
+    data = [str(i) * 10 for i in range(2000)]
+    return {'statusCode': 200, 'body': json.dumps(data[:3])}
+
+
+@pytest.fixture
+def profile_config(monkeypatch):
+    """Install a profiling config for the duration of a test"""
+    def install(**overrides):
+        config = load_config({})
+        config.update(overrides)
+        monkeypatch.setattr(profiling, 'PROFILE_CONFIG', config)
+        return config
+    return install
+
+
+def _profile_records(caplog):
+    return [json.loads(r.getMessage()) for r in caplog.records
+            if r.name == 'profiling' and 'request_profile' in r.getMessage()]
+
+
+class TestProfilingConfig:
+    """Tests for reading profiling settings from the environment"""
+
+    def test_disabled_by_default(self):
+        """Test that profiling is off with no environment variables"""
+        config = load_config({})
+        assert config['sample_rate'] == 0
+        assert config['tracemalloc'] is False
+        assert config['query_flag'] is False
+
+    def test_reads_environment(self):
+        """Test that environment variables are parsed"""
+        config = load_config({
+            'PROFILE_SAMPLE_RATE': '10',
+            'PROFILE_TRACEMALLOC': 'true',
+            'PROFILE_TOP_N': '5',
+            'PROFILE_SORT': 'cumulative',
+        })
+        assert config['sample_rate'] == 10
+        assert config['tracemalloc'] is True
+        assert config['top_n'] == 5
+        assert config['sort'] == 'cumulative'
+
+
+class TestProfileRequest:
+    """Tests for the profile_request decorator"""
+
+    def test_unsampled_request_not_profiled(self, profile_config, caplog):
+        """Test that no profile is logged when sampling is disabled"""
+        profile_config()
+        caplog.set_level(logging.INFO)
+
+        response = profile_request(_busy_handler)({'queryStringParameters': None}, None)
+
+        assert response['statusCode'] == 200
+        assert _profile_records(caplog) == []
+
+    def test_every_request_sampled(self, profile_config, caplog):
+        """Test that a sample rate of 1 profiles every request"""
+        profile_config(sample_rate=1, top_n=5)
+        caplog.set_level(logging.INFO)
+
+        wrapped = profile_request(_busy_handler)
+        wrapped({'queryStringParameters': None}, None)
+        wrapped({'queryStringParameters': None}, None)
+
+        records = _profile_records(caplog)
+        assert len(records) == 2
+        assert records[0]['status_code'] == 200
+        assert 0 < len(records[0]['top_functions']) <= 5
+        assert 'top_allocations' not in records[0]
+
+    def test_one_in_n_sampling(self, profile_config, caplog):
+        """Test that only 1 in N requests is profiled"""
+        profile_config(sample_rate=4)
+        caplog.set_level(logging.INFO)
+
+        wrapped = profile_request(_busy_handler)
+        for _ in range(8):
+            wrapped({'queryStringParameters': None}, None)
+
+        assert len(_profile_records(caplog)) == 2
+
+    def test_tracemalloc_allocations(self, profile_config, caplog):
+        """Test that allocation sites are reported when tracemalloc is enabled"""
+        profile_config(sample_rate=1, tracemalloc=True)
+        caplog.set_level(logging.INFO)
+
+        profile_request(_busy_handler)({'queryStringParameters': None}, None)
+
+        records = _profile_records(caplog)
+        assert records[0]['top_allocations']
+
+    def test_query_flag_requires_opt_in(self, profile_config, caplog):
+        """Test that ?profile=1 only works when the query flag is enabled"""
+        caplog.set_level(logging.INFO)
+        event = {'queryStringParameters': {'profile': '1'}}
+
+        profile_config()
+        profile_request(_busy_handler)(event, None)
+        assert _profile_records(caplog) == []
+
+        profile_config(query_flag=True)
+        profile_request(_busy_handler)(event, None)
+        assert len(_profile_records(caplog)) == 1
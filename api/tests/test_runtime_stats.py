@@ -0,0 +1,78 @@
+"""
+Pytest tests for always-on runtime statistics
+"""
+import functools
+
+import pytest
+
+import runtime_stats
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    """Start each test with empty counters"""
+    runtime_stats.reset()
+    yield
+    runtime_stats.reset()
+
+
+class TestRuntimeStats:
+    """Tests for the runtime statistics recorders"""
+
+    def test_latency_percentiles(self):
+        """Test rolling percentiles over recorded latencies"""
+        for ms in range(1, 101):
+            runtime_stats.record_latency('op', ms / 1000)
+        summary = runtime_stats.latency_summary('op')
+
+        assert summary['calls'] == 100
+        assert summary['p50_ms'] == pytest.approx(51)
+        assert summary['p99_ms'] == pytest.approx(100)
+        assert summary['max_ms'] == pytest.approx(100)
+        assert runtime_stats.latency_summary('unknown') is None
+
+    def test_latency_window_is_bounded(self):
+        """Test that only the most recent calls are kept"""
+        for _ in range(runtime_stats.LATENCY_WINDOW + 10):
+            runtime_stats.record_latency('op', 0.001)
+        summary = runtime_stats.latency_summary('op')
+
+        assert summary['window'] == runtime_stats.LATENCY_WINDOW
+        assert summary['calls'] == runtime_stats.LATENCY_WINDOW + 10
+
+    def test_timed_records_failures(self):
+        """Test that timed functions are recorded even when they raise"""
+        @runtime_stats.timed('failing')
+        def failing():
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError):
+            failing()
+        assert runtime_stats.latency_summary('failing')['calls'] == 1
+
+    def test_filter_stats_accumulate(self):
+        """Test that filter statistics are summed across searches"""
+        runtime_stats.record_filter_stats({'attempts': 3, 'no_definition': 2, 'profanity_word': 0})
+        runtime_stats.record_filter_stats({'attempts': 1, 'no_definition': 1})
+
+        assert runtime_stats.snapshot()['filter_stats'] == {'attempts': 4, 'no_definition': 3}
+
+    def test_cache_summary(self):
+        """Test hit rate and eviction counts from an lru_cache"""
+        @functools.lru_cache(maxsize=2)
+        def square(x):
+            return x * x
+
+        for x in (1, 2, 1, 3, 1):
+            square(x)
+        summary = runtime_stats.cache_summary(square)
+
+        assert summary['hits'] == 2
+        assert summary['misses'] == 3
+        assert summary['hit_rate'] == 0.4
+        assert summary['evictions'] == 1
+
+    def test_snapshot_memory(self):
+        """Test that the snapshot reports process memory"""
+        memory = runtime_stats.snapshot()['memory']
+        assert memory['max_rss_mb'] > 0
@@ -0,0 +1,87 @@
+"""
+Pytest tests for the no-repeat seen words token
+"""
+from seen_words import SeenWordsFilter, MAX_FILL_RATIO, MAX_TOKEN_LENGTH
+import pytest
+
+
+class TestSeenWordsFilter:
+    """Tests for the Bloom filter token used to avoid repeat words"""
+
+    def test_added_word_is_seen(self):
+        """Test that an added word is always reported as seen"""
+        seen = SeenWordsFilter()
+        seen.add("elephant")
+        assert "elephant" in seen
+        assert "ELEPHANT" in seen
+
+    def test_unseen_word_not_seen(self):
+        """Test that an empty filter reports nothing as seen"""
+        seen = SeenWordsFilter()
+        assert "elephant" not in seen
+        assert seen.count == 0
+
+    def test_token_round_trip(self):
+        """Test that a token restores the same filter state"""
+        seen = SeenWordsFilter()
+        for word in ["apple", "house", "tiger"]:
+            seen.add(word)
+
+        restored = SeenWordsFilter.from_token(seen.to_token())
+
+        assert restored.count == 3
+        for word in ["apple", "house", "tiger"]:
+            assert word in restored
+
+    def test_token_size_bounded(self):
+        """Test that the token stays bounded after hundreds of games"""
+        seen = SeenWordsFilter()
+        for i in range(1000):
+            seen.add(f"word{i}")
+
+        token = seen.to_token()
+        assert len(token) <= MAX_TOKEN_LENGTH
+        assert all(f"word{i}" in SeenWordsFilter.from_token(token) for i in range(1000))
+
+    def test_false_positive_rate_low(self):
+        """Test that few unseen words are excluded after 300 games"""
+        seen = SeenWordsFilter()
+        for i in range(300):
+            seen.add(f"served{i}")
+
+        false_positives = sum(f"other{i}" in seen for i in range(10000))
+        assert false_positives < 200
+
+    def test_rotate_if_saturated(self):
+        """Test that a saturated filter is cleared to bound false positives"""
+        seen = SeenWordsFilter()
+        for i in range(100):
+            seen.add(f"served{i}")
+        assert not seen.rotate_if_saturated()
+        assert "served1" in seen
+
+        for i in range(100, 1000):
+            seen.add(f"served{i}")
+        assert seen.fill_ratio() >= MAX_FILL_RATIO
+        assert seen.rotate_if_saturated()
+        assert seen.count == 0
+        assert "served1" not in seen
+
+    def test_false_positive_rate_bounded_at_rotation(self):
+        """Test that the false-positive rate just below the rotation point stays small"""
+        seen = SeenWordsFilter()
+        i = 0
+        while True:
+            seen.add(f"served{i}")
+            if seen.fill_ratio() >= MAX_FILL_RATIO:
+                break
+            i += 1
+
+        false_positives = sum(f"other{j}" in seen for j in range(10000))
+        assert false_positives < 300
+
+    @pytest.mark.parametrize("token", ["not-a-token", "abc", "A" * (MAX_TOKEN_LENGTH + 1)])
+    def test_malformed_token_rejected(self, token):
+        """Test that corrupt or oversized tokens raise ValueError"""
+        with pytest.raises(ValueError):
+            SeenWordsFilter.from_token(token)
@@ -0,0 +1,55 @@
+"""
+Pytest tests for the streaming vocabulary export
+"""
+from vocabulary import export_vocabulary, iter_gzip, iter_ndjson
+from handler import is_word_valid
+import gzip
+import json
+import pytest
+
+
+def _entries(chunks):
+    return [json.loads(line) for line in b''.join(chunks).decode('utf-8').splitlines()]
+
+
+class TestVocabularyExport:
+    """Tests for the NDJSON export pipeline"""
+
+    def test_export_respects_length_range(self):
+        """Test that only words within the length range are exported"""
+        entries = _entries(export_vocabulary(5, 6))
+
+        assert entries
+        assert all(5 <= entry['length'] <= 6 for entry in entries)
+        assert all(entry['length'] == len(entry['word']) for entry in entries)
+
+    def test_exported_words_pass_filters(self):
+        """Test that every exported word passes the content filters"""
+        for entry in _entries(export_vocabulary(4, 4)):
+            is_valid, reason = is_word_valid(entry['word'].lower(), 4)
+            assert is_valid, reason
+            assert entry['word'].isupper()
+            assert isinstance(entry['definitions'], list)
+
+    def test_export_is_lazy(self):
+        """Test that the export is a generator rather than a materialized list"""
+        chunks = export_vocabulary(3, 3)
+        first = next(chunks)
+        assert first.endswith(b'\n')
+
+    def test_gzip_export_round_trip(self):
+        """Test that the gzipped stream decompresses to the plain stream"""
+        plain = b''.join(export_vocabulary(5, 5))
+        compressed = b''.join(export_vocabulary(5, 5, compress=True))
+
+        assert gzip.decompress(compressed) == plain
+
+    def test_gzip_of_empty_stream(self):
+        """Test that an empty stream still produces a valid gzip member"""
+        assert gzip.decompress(b''.join(iter_gzip(iter_ndjson([])))) == b''
+
+    @pytest.mark.parametrize("min_length,max_length", [(2, None), (8, 5)])
+    def test_invalid_length_range(self, min_length, max_length):
+        """Test that invalid length ranges are rejected"""
+        with pytest.raises(ValueError):
+            export_vocabulary(min_length, max_length)
@@ -0,0 +1,124 @@
+"""
+Pytest tests for background-refilled word pools
+"""
+import threading
+import time
+
+import pytest
+
+from seen_words import SeenWordsFilter
+from word_pool import WordPool
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError('condition not met in time')
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def counter_pool():
+    """Pool whose generator returns numbered words per length"""
+    counts = {}
+
+    def generate(length):
+        counts[length] = counts.get(length, 0) + 1
+        return {'word': f'W{length}-{counts[length]}', 'length': length, 'definitions': [], 'attempts': 1}
+
+    pool = WordPool(generate, low_watermark=2, high_watermark=5)
+    yield pool
+    pool.stop()
+
+
+class TestWordPool:
+    """Tests for WordPool refills and metrics"""
+
+    def test_first_take_misses_and_triggers_refill(self, counter_pool):
+        """Test that demand for a new length fills its queue in the background"""
+        assert counter_pool.take(5) is None
+        _wait_for(lambda: counter_pool.stats()['lengths']['5']['refills'] == 1)
+
+        stats = counter_pool.stats()['lengths']['5']
+        assert stats['depth'] == 5
+        assert stats['misses'] == 1
+        assert stats['last_refill_lag_ms'] is not None
+
+    def test_take_pops_ready_words(self, counter_pool):
+        """Test that ready words are served in order and refilled at the low watermark"""
+        counter_pool.take(5)
+        _wait_for(lambda: counter_pool.stats()['lengths']['5']['depth'] == 5)
+
+        words = [counter_pool.take(5)['word'] for _ in range(4)]
+        assert words == ['W5-1', 'W5-2', 'W5-3', 'W5-4']
+        _wait_for(lambda: counter_pool.stats()['lengths']['5']['refills'] == 2)
+        assert counter_pool.stats()['lengths']['5']['depth'] == 5
+
+    def test_take_skips_seen_words(self, counter_pool):
+        """Test that words the client has seen are skipped and kept for others"""
+        counter_pool.take(5)
+        _wait_for(lambda: counter_pool.stats()['lengths']['5']['depth'] == 5)
+        seen = SeenWordsFilter()
+        seen.add('W5-1')
+
+        assert counter_pool.take(5, seen)['word'] == 'W5-2'
+        assert counter_pool.take(5)['word'] == 'W5-3'
+
+    def test_failed_length_not_retried(self):
+        """Test that a length whose generation fails is not refilled again"""
+        calls = []
+
+        def generate(length):
+            calls.append(length)
+            raise Exception(f'No words of length {length} found in WordNet')
+
+        pool = WordPool(generate, low_watermark=1, high_watermark=2)
+        try:
+            pool.take(40)
+            _wait_for(lambda: pool.stats()['lengths']['40']['failed'])
+            pool.take(40)
+            time.sleep(0.05)
+            assert calls == [40]
+        finally:
+            pool.stop()
+
+    def test_failed_lengths_free_their_slot(self):
+        """Test that lengths whose refill failed don't use up max_lengths"""
+        def generate(length):
+            if length > 10:
+                raise Exception(f'No words of length {length} found in WordNet')
+            return {'word': 'READY', 'length': length, 'definitions': [], 'attempts': 1}
+
+        pool = WordPool(generate, low_watermark=1, high_watermark=2, max_lengths=2)
+        try:
+            for length in (100, 101, 102):
+                pool.take(length)
+                _wait_for(lambda: pool.stats()['lengths'][str(length)]['failed'])
+            pool.take(6)
+            _wait_for(lambda: pool.stats()['lengths']['6']['depth'] == 2)
+        finally:
+            pool.stop()
+
+    def test_stop_joins_worker(self):
+        """Test that stop() ends the worker thread mid-refill"""
+        started = threading.Event()
+
+        def generate(length):
+            started.set()
+            time.sleep(0.01)
+            return {'word': 'SLOW', 'length': length, 'definitions': [], 'attempts': 1}
+
+        pool = WordPool(generate, low_watermark=10, high_watermark=1000)
+        pool.take(4)
+        started.wait(1)
+        pool.stop()
+
+        assert not pool.stats()['running']
+        assert pool.stats()['lengths']['4']['depth'] < 1000
+        assert pool.take(6) is None
+
+    def test_invalid_watermarks(self):
+        """Test that watermarks are validated"""
+        with pytest.raises(ValueError):
+            WordPool(lambda length: {}, low_watermark=10, high_watermark=5)
@@ -0,0 +1,77 @@
+"""
+Pytest tests for the compact word store
+"""
+from word_store import CompactWordStore, WordEntry
+from array import array
+import pytest
+
+ENTRIES = [
+    {'word': 'HOUSE', 'length': 5, 'definitions': ['a dwelling', 'a building']},
+    {'word': 'CAT', 'length': 3, 'definitions': ['feline mammal']},
+    {'word': 'TIGER', 'length': 5, 'definitions': ['large feline', 'feline mammal']},
+    {'word': 'ELEPHANT', 'length': 8, 'definitions': []},
+]
+
+
+@pytest.fixture
+def store():
+    return CompactWordStore.build(ENTRIES)
+
+
+class TestCompactWordStore:
+    """Tests for packing and reading word entries"""
+
+    def test_entries_round_trip(self, store):
+        """Test that every entry reads back unchanged"""
+        by_word = {store[i].word: store[i].to_dict() for i in range(len(store))}
+        assert len(store) == 4
+        for entry in ENTRIES:
+            assert by_word[entry['word']] == entry
+
+    def test_length_ranges(self, store):
+        """Test that each length is a contiguous id range"""
+        start, end = store.length_range(5)
+        assert end - start == 2
+        assert {store.word(i) for i in range(start, end)} == {'HOUSE', 'TIGER'}
+        assert store.length_range(4) == (0, 0)
+        assert store.lengths() == {3: 1, 5: 2, 8: 1}
+
+    def test_definitions_deduplicated(self, store):
+        """Test that shared definitions are stored once"""
+        assert store._definitions.count(b'feline mammal') == 1
+
+    def test_entry_view(self, store):
+        """Test that entries are slotted views onto the store"""
+        entry = store[0]
+        assert isinstance(entry, WordEntry)
+        assert not hasattr(entry, '__dict__')
+        assert entry.length == len(entry.word)
+        with pytest.raises(IndexError):
+            store[len(store)]
+
+    def test_lowercase_words_uppercased(self):
+        """Test that words are stored in uppercase like API responses"""
+        store = CompactWordStore.build([{'word': 'cat', 'length': 3, 'definitions': ['feline']}])
+        assert store.word(0) == 'CAT'
+
+    def test_save_and_load(self, store, tmp_path):
+        """Test that a saved store loads with the same entries and arrays"""
+        store.arrays['example'] = array('I', [2, 0, 3])
+        store.metadata['built_at'] = 'now'
+        path = str(tmp_path / 'index.bin')
+        store.save(path)
+
+        loaded = CompactWordStore.load(path)
+
+        assert [loaded[i].to_dict() for i in range(len(loaded))] == \
+            [store[i].to_dict() for i in range(len(store))]
+        assert loaded.lengths() == store.lengths()
+        assert list(loaded.arrays['example']) == [2, 0, 3]
+        assert loaded.metadata == {'built_at': 'now'}
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test that loading a non-index file raises ValueError"""
+        path = tmp_path / 'not_an_index.bin'
+        path.write_bytes(b'hello world')
+        with pytest.raises(ValueError):
+            CompactWordStore.load(str(path))
@@ -1,14 +1,107 @@
-import type { WordData } from './types';
+import type { WordData, WordBatch } from './types';
+import { loadShard, sampleShardWord } from './wordShards';
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
-export async function fetchWord(length: number): Promise<WordData> {
-    const response = await fetch(`${API_BASE_URL}/word?length=${length}`);
+// Opaque no-repeat token returned by the API, persisted across sessions
+const SEEN_TOKEN_KEY = 'hangman.seenToken';
+
+// Words kept ready per length, and the level at which a background refill starts
+const POOL_SIZE = 5;
+const POOL_REFILL_THRESHOLD = 2;
+
+const wordPools = new Map<number, WordData[]>();
+const pendingRefills = new Map<number, Promise<void>>();
+
+function loadSeenToken(): string | null {
+    try {
+        return localStorage.getItem(SEEN_TOKEN_KEY);
+    } catch {
+        return null;
+    }
+}
+
+function saveSeenToken(token: string): void {
+    try {
+        localStorage.setItem(SEEN_TOKEN_KEY, token);
+    } catch {
+        // Storage unavailable (private mode etc.) - repeats become possible
+    }
+}
+
+async function fetchWordBatch(length: number, count: number): Promise<WordData[]> {
+    const params = new URLSearchParams({ length: String(length), count: String(count) });
+    const seenToken = loadSeenToken();
+    if (seenToken) {
+        params.set('seen', seenToken);
+    }
+
+    const response = await fetch(`${API_BASE_URL}/word?${params}`);
 
     if (!response.ok) {
         const error = await response.json();
         throw new Error(error.error || 'Failed to fetch word');
     }
 
-    return response.json();
+    const data: WordBatch = await response.json();
+    if (data.seen) {
+        saveSeenToken(data.seen);
+    }
+    return data.words;
+}
+
+function refillPool(length: number): Promise<void> {
+    // Share one in-flight batch request per length
+    const pending = pendingRefills.get(length);
+    if (pending) {
+        return pending;
+    }
+
+    const pool = wordPools.get(length) ?? [];
+    wordPools.set(length, pool);
+
+    const refill = fetchWordBatch(length, POOL_SIZE - pool.length)
+        .then(words => {
+            pool.push(...words);
+        })
+        .finally(() => {
+            pendingRefills.delete(length);
+        });
+
+    pendingRefills.set(length, refill);
+    return refill;
+}
+
+// Warm the static shard for a length, or top up the API pool when there is none
+export function prefetchWords(length: number): void {
+    loadShard(length).then(shard => {
+        const pool = wordPools.get(length) ?? [];
+        if (!shard && pool.length <= POOL_REFILL_THRESHOLD) {
+            return refillPool(length);
+        }
+    }).catch(() => {
+        // Ignored - fetchWord retries and surfaces the error
+    });
+}
+
+export async function fetchWord(length: number): Promise<WordData> {
+    // Static shards served by CloudFront avoid the API entirely
+    const shardWord = await sampleShardWord(length);
+    if (shardWord) {
+        return shardWord;
+    }
+
+    let pool = wordPools.get(length);
+    if (!pool || pool.length === 0) {
+        await refillPool(length);
+        pool = wordPools.get(length);
+    }
+
+    const word = pool?.shift();
+    if (!word) {
+        throw new Error('Failed to fetch word');
+    }
+
+    prefetchWords(length);
+    return word;
 }
@@ -1,4 +1,5 @@
 import type { FigureType, Difficulty } from '../types';
+import { prefetchWords } from '../api';
 
 interface GameSettingsProps {
     figureType: FigureType;
@@ -54,7 +55,12 @@ export default function GameSettings({
                 <select
                     id="word-length"
                     value={wordLength}
-                    onChange={(e) => onWordLengthChange(parseInt(e.target.value))}
+                    onChange={(e) => {
+                        const length = parseInt(e.target.value);
+                        // Warm the word pool so the next game starts instantly
+                        prefetchWords(length);
+                        onWordLengthChange(length);
+                    }}
                     disabled={disabled}
                 >
                     {Array.from({ length: 18 }, (_, i) => i + 3).map(length => (
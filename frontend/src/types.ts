@@ -7,6 +7,12 @@ export interface WordData {
     length: number;
     definitions: string[];
     attempts: number;
+    seen?: string;
+}
+
+export interface WordBatch {
+    words: WordData[];
+    seen?: string;
 }
 
 export interface GameState {
@@ -0,0 +1,150 @@
+import type { WordData } from './types';
+
+// Static per-length word shards published next to the app (empty string disables)
+const SHARDS_BASE_URL = import.meta.env.VITE_WORD_SHARDS_URL ?? '/word-shards';
+
+interface ShardManifest {
+    version: number;
+    shards: Record<string, { file: string; count: number }>;
+}
+
+interface WordShard {
+    length: number;
+    words: string[];
+    definitions: string[][];
+    // Content-hashed file name from the manifest, identifies the shard version
+    file: string;
+}
+
+let manifestRequest: Promise<ShardManifest | null> | null = null;
+const shardRequests = new Map<number, Promise<WordShard | null>>();
+
+// Bitsets of indices already served from each shard, persisted per shard file
+// so words don't repeat across reloads; a rebuilt shard starts afresh
+const SERVED_KEY_PREFIX = 'hangman.shardServed.';
+const servedIndices = new Map<number, Uint8Array>();
+
+function loadServed(shard: WordShard): Uint8Array {
+    let served = servedIndices.get(shard.length);
+    if (served) {
+        return served;
+    }
+
+    served = new Uint8Array(Math.ceil(shard.words.length / 8));
+    try {
+        const stored = localStorage.getItem(SERVED_KEY_PREFIX + shard.file);
+        if (stored) {
+            const bytes = Uint8Array.from(atob(stored), c => c.charCodeAt(0));
+            if (bytes.length === served.length) {
+                served = bytes;
+            }
+        }
+        // Drop state kept for older versions of this length's shard
+        const stalePrefix = `${SERVED_KEY_PREFIX}words-${shard.length}.`;
+        for (let i = localStorage.length - 1; i >= 0; i--) {
+            const key = localStorage.key(i);
+            if (key?.startsWith(stalePrefix) && key !== SERVED_KEY_PREFIX + shard.file) {
+                localStorage.removeItem(key);
+            }
+        }
+    } catch {
+        // Storage unavailable or corrupt - track this session only
+    }
+
+    servedIndices.set(shard.length, served);
+    return served;
+}
+
+function saveServed(shard: WordShard, served: Uint8Array): void {
+    try {
+        localStorage.setItem(SERVED_KEY_PREFIX + shard.file, btoa(String.fromCharCode(...served)));
+    } catch {
+        // Storage unavailable (private mode etc.) - repeats possible after reload
+    }
+}
+
+function isServed(served: Uint8Array, index: number): boolean {
+    return (served[index >> 3] & (1 << (index & 7))) !== 0;
+}
+
+function countServed(served: Uint8Array): number {
+    let count = 0;
+    for (let byte of served) {
+        for (; byte; byte &= byte - 1) {
+            count++;
+        }
+    }
+    return count;
+}
+
+async function fetchJson<T>(url: string): Promise<T | null> {
+    try {
+        const response = await fetch(url);
+        // CloudFront serves index.html for missing objects, so check the type too
+        if (!response.ok || !response.headers.get('content-type')?.includes('json')) {
+            return null;
+        }
+        return await response.json();
+    } catch {
+        return null;
+    }
+}
+
+function loadManifest(): Promise<ShardManifest | null> {
+    if (!SHARDS_BASE_URL) {
+        return Promise.resolve(null);
+    }
+    manifestRequest ??= fetchJson<ShardManifest>(`${SHARDS_BASE_URL}/manifest.json`);
+    return manifestRequest;
+}
+
+export function loadShard(length: number): Promise<WordShard | null> {
+    let request = shardRequests.get(length);
+    if (!request) {
+        request = loadManifest().then(manifest => {
+            const entry = manifest?.shards[String(length)];
+            if (!entry || entry.count === 0) {
+                return null;
+            }
+            return fetchJson<Omit<WordShard, 'file'>>(`${SHARDS_BASE_URL}/${entry.file}`)
+                .then(shard => shard && { ...shard, file: entry.file });
+        });
+        shardRequests.set(length, request);
+    }
+    return request;
+}
+
+// Draw an unserved word from the local shard, or null if there is no shard.
+// Once every word has been served the shard starts over, like the API's seen token.
+export async function sampleShardWord(length: number): Promise<WordData | null> {
+    const shard = await loadShard(length);
+    if (!shard || shard.words.length === 0) {
+        return null;
+    }
+
+    const served = loadServed(shard);
+    let unserved = shard.words.length - countServed(served);
+    if (unserved === 0) {
+        served.fill(0);
+        unserved = shard.words.length;
+    }
+
+    // Walk to the k-th unserved index so every unserved word is equally likely
+    let k = Math.floor(Math.random() * unserved);
+    let index = 0;
+    while (isServed(served, index) || k > 0) {
+        if (!isServed(served, index)) {
+            k--;
+        }
+        index++;
+    }
+    served[index >> 3] |= 1 << (index & 7);
+    saveServed(shard, served);
+
+    return {
+        word: shard.words[index],
+        length: shard.length,
+        definitions: shard.definitions[index],
+        attempts: 0
+    };
+}
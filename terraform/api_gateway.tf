@@ -56,3 +56,15 @@ resource "aws_apigatewayv2_route" "word_route" {
   route_key = "GET /word"
   target    = "integrations/${aws_apigatewayv2_integration.lambda_integration.id}"
 }
+
+resource "aws_apigatewayv2_route" "anagrams_route" {
+  api_id    = module.api_gateway.api_id
+  route_key = "GET /anagrams"
+  target    = "integrations/${aws_apigatewayv2_integration.lambda_integration.id}"
+}
+
+resource "aws_apigatewayv2_route" "subwords_route" {
+  api_id    = module.api_gateway.api_id
+  route_key = "GET /subwords"
+  target    = "integrations/${aws_apigatewayv2_integration.lambda_integration.id}"
+}
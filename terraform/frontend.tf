@@ -58,6 +58,23 @@ resource "null_resource" "build_frontend" {
   }
 }
 
+# Build static per-length word shards so most games are served from CloudFront
+resource "null_resource" "build_word_shards" {
+  triggers = {
+    # Rebuild when the filters or the shard format change
+    handler_hash    = filesha256("${path.module}/../api/lambda/handler.py")
+    vocabulary_hash = filesha256("${path.module}/../api/lambda/vocabulary.py")
+    script_hash     = filesha256("${path.module}/../api/build_word_shards.py")
+  }
+
+  provisioner "local-exec" {
+    working_dir = "${path.module}/../api"
+    command     = "NLTK_DATA=lambda/nltk_data uv run python build_word_shards.py --output build/word-shards"
+  }
+
+  depends_on = [null_resource.download_nltk_data]
+}
+
 # Use a separate null_resource to sync files to avoid the fileset timing issue
 resource "null_resource" "sync_frontend_to_s3" {
   triggers = {
@@ -70,7 +87,8 @@ resource "null_resource" "sync_frontend_to_s3" {
         --delete \
         --cache-control "public, max-age=31536000, immutable" \
         --exclude "index.html" \
-        --exclude "*.html"
+        --exclude "*.html" \
+        --exclude "word-shards/*"
       
       # Upload HTML files separately with different cache settings
       aws s3 sync ${path.module}/../frontend/dist s3://${module.frontend_website.s3_bucket_id}/ \
@@ -83,15 +101,40 @@ resource "null_resource" "sync_frontend_to_s3" {
   depends_on = [null_resource.build_frontend]
 }
 
+# Publish word shards: content-hashed shards are immutable, the manifest is short-lived
+resource "null_resource" "sync_word_shards_to_s3" {
+  triggers = {
+    build_id = null_resource.build_word_shards.id
+  }
+
+  provisioner "local-exec" {
+    command = <<-EOT
+      aws s3 sync ${path.module}/../api/build/word-shards s3://${module.frontend_website.s3_bucket_id}/word-shards/ \
+        --delete \
+        --exclude "manifest.json" \
+        --content-type "application/json" \
+        --content-encoding "gzip" \
+        --cache-control "public, max-age=31536000, immutable"
+
+      aws s3 cp ${path.module}/../api/build/word-shards/manifest.json s3://${module.frontend_website.s3_bucket_id}/word-shards/manifest.json \
+        --content-type "application/json" \
+        --cache-control "public, max-age=300"
+    EOT
+  }
+
+  depends_on = [null_resource.build_word_shards]
+}
+
 # Invalidate CloudFront cache after uploading new files
 resource "null_resource" "invalidate_cloudfront" {
   triggers = {
-    sync_id = null_resource.sync_frontend_to_s3.id
+    sync_id        = null_resource.sync_frontend_to_s3.id
+    shards_sync_id = null_resource.sync_word_shards_to_s3.id
   }
 
   provisioner "local-exec" {
     command = "aws cloudfront create-invalidation --distribution-id ${module.frontend_website.cloudfront_distribution_id} --paths '/*'"
   }
 
-  depends_on = [null_resource.sync_frontend_to_s3]
+  depends_on = [null_resource.sync_frontend_to_s3, null_resource.sync_word_shards_to_s3]
 }
@@ -53,6 +53,26 @@ resource "null_resource" "download_nltk_data" {
   }
 }
 
+# Prefilter the vocabulary into the compact word index packaged with the handler
+resource "null_resource" "build_word_index" {
+  triggers = {
+    # Rebuild when the filters or the index format change
+    handler_hash    = filesha256("${path.module}/../api/lambda/handler.py")
+    vocabulary_hash = filesha256("${path.module}/../api/lambda/vocabulary.py")
+    store_hash      = filesha256("${path.module}/../api/lambda/word_store.py")
+    categories_hash = filesha256("${path.module}/../api/lambda/categories.py")
+    difficulty_hash = filesha256("${path.module}/../api/lambda/difficulty.py")
+    script_hash     = filesha256("${path.module}/../api/build_word_index.py")
+  }
+
+  provisioner "local-exec" {
+    working_dir = "${path.module}/../api"
+    command     = "NLTK_DATA=lambda/nltk_data uv run python build_word_index.py"
+  }
+
+  depends_on = [null_resource.download_nltk_data]
+}
+
 module "lambda_function" {
   source  = "terraform-aws-modules/lambda/aws"
   version = "~> 8.1"
@@ -73,8 +93,11 @@ module "lambda_function" {
   memory_size   = var.lambda_memory_size
 
   environment_variables = {
-    PYTHONPATH = "/var/task"
-    NLTK_DATA  = "/var/task/nltk_data"
+    PYTHONPATH             = "/var/task"
+    NLTK_DATA              = "/var/task/nltk_data"
+    PROFILE_SAMPLE_RATE    = tostring(var.profile_sample_rate)
+    PROFILE_TRACEMALLOC    = tostring(var.profile_tracemalloc)
+    WORD_GENERATION_SLO_MS = tostring(var.word_generation_slo_ms)
   }
 
   create_role                       = false
@@ -82,7 +105,7 @@ module "lambda_function" {
   cloudwatch_logs_retention_in_days = var.log_retention_days
   include_default_tag               = false
 
-  depends_on = [null_resource.download_nltk_data]
+  depends_on = [null_resource.download_nltk_data, null_resource.build_word_index]
 }
 
 resource "aws_lambda_permission" "api_gateway" {
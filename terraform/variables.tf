@@ -73,8 +73,26 @@ variable "log_retention_days" {
   default     = 7
 }
 
+variable "profile_sample_rate" {
+  description = "Profile 1 in N Lambda requests with cProfile and log the hot spots (0 disables)"
+  type        = number
+  default     = 0
+}
+
+variable "profile_tracemalloc" {
+  description = "Also record allocation sites with tracemalloc for profiled requests"
+  type        = bool
+  default     = false
+}
+
 variable "project_name" {
   description = "Name of the project"
   type        = string
   default     = "hangman"
 }
+
+variable "word_generation_slo_ms" {
+  description = "Cap on word generation time in milliseconds (0 uses the Lambda's remaining time)"
+  type        = number
+  default     = 0
+}